@@ -1,3 +1,5 @@
 """French Political Speeches Data Pipeline."""
 
-__version__ = "0.1.0"
+from ._version import __version__
+
+__all__ = ["__version__"]
@@ -0,0 +1,3 @@
+"""Package version, kept in a leaf module so it can be read without side effects."""
+
+__version__ = "0.1.0"
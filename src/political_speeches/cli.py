@@ -1,17 +1,14 @@
 """Command-line interface for the political speeches pipeline."""
 
-import asyncio
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from .config import Config
-from .pipeline import Pipeline
-from .utils.logging import setup_logging
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="political-speeches",
@@ -19,14 +16,22 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+_VALID_SOURCES = frozenset({"vie_publique", "senat", "assemblee", "europarl"})
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        from . import __version__
-        console.print(f"political-speeches version {__version__}")
+        from ._version import __version__
+        _console().print(f"political-speeches version {__version__}")
         raise typer.Exit()
 
 
@@ -90,18 +95,21 @@ def run(
 
     Executes all stages: collect, parse, clean, deduplicate, export.
     """
+    from .config import Config
+    from .pipeline import Pipeline
+
     # Load config
     if config_path:
-        if not config_path.exists():
-            console.print(f"[red]Config file not found: {config_path}[/red]")
+        try:
+            config = Config.from_yaml(config_path)
+        except FileNotFoundError:
+            _console().print(f"[red]Config file not found: {config_path}[/red]")
             raise typer.Exit(1)
-        config = Config.from_yaml(config_path)
     else:
         # Try default config location
-        default_config = Path("config/default.yaml")
-        if default_config.exists():
-            config = Config.from_yaml(default_config)
-        else:
+        try:
+            config = Config.from_yaml(Path("config/default.yaml"))
+        except FileNotFoundError:
             config = Config.default()
 
     # Apply overrides
@@ -109,14 +117,14 @@ def run(
         try:
             config.pipeline.date_range.start = date.fromisoformat(start_date)
         except ValueError:
-            console.print(f"[red]Invalid start date format: {start_date}[/red]")
+            _console().print(f"[red]Invalid start date format: {start_date}[/red]")
             raise typer.Exit(1)
 
     if end_date:
         try:
             config.pipeline.date_range.end = date.fromisoformat(end_date)
         except ValueError:
-            console.print(f"[red]Invalid end date format: {end_date}[/red]")
+            _console().print(f"[red]Invalid end date format: {end_date}[/red]")
             raise typer.Exit(1)
 
     if output_dir:
@@ -124,34 +132,39 @@ def run(
 
     if sources:
         # Disable all, then enable specified
-        config.sources.vie_publique.enabled = "vie_publique" in sources
-        config.sources.senat.enabled = "senat" in sources
-        config.sources.assemblee.enabled = "assemblee" in sources
-        config.sources.europarl.enabled = "europarl" in sources
+        wanted = frozenset(sources)
+        unknown = wanted - _VALID_SOURCES
+        if unknown:
+            raise typer.BadParameter(
+                f"Unknown source(s): {', '.join(sorted(unknown))}",
+                param_hint="--source",
+            )
+        for name in _VALID_SOURCES:
+            getattr(config.sources, name).enabled = name in wanted
 
     if verbose:
         config.pipeline.log_level = "DEBUG"
 
     # Run pipeline
-    console.print("[bold]Starting French Political Speeches Pipeline[/bold]")
-    console.print(
+    _console().print("[bold]Starting French Political Speeches Pipeline[/bold]")
+    _console().print(
         f"Date range: {config.pipeline.date_range.start} to "
         f"{config.pipeline.date_range.end}"
     )
-    console.print(f"Enabled sources: {', '.join(config.get_enabled_sources())}")
-    console.print()
+    _console().print(f"Enabled sources: {', '.join(config.get_enabled_sources())}")
+    _console().print()
 
     try:
         pipeline = Pipeline(config)
         manifest = pipeline.run()
 
-        console.print(f"\n[green]Output: {config.pipeline.output_dir / 'curated.jsonl'}[/green]")
-        console.print(f"[green]Manifest: {config.pipeline.output_dir / 'manifest.json'}[/green]")
+        _console().print(f"\n[green]Output: {config.pipeline.output_dir / 'curated.jsonl'}[/green]")
+        _console().print(f"[green]Manifest: {config.pipeline.output_dir / 'manifest.json'}[/green]")
 
     except Exception as e:
-        console.print(f"[red]Pipeline failed: {e}[/red]")
+        _console().print(f"[red]Pipeline failed: {e}[/red]")
         if verbose:
-            console.print_exception()
+            _console().print_exception()
         raise typer.Exit(1)
 
 
@@ -178,29 +191,34 @@ def collect_only(
 
     Useful for testing collection or downloading data incrementally.
     """
-    valid_sources = ["vie_publique", "senat", "assemblee", "europarl"]
-    if source not in valid_sources:
-        console.print(f"[red]Invalid source: {source}[/red]")
-        console.print(f"Valid sources: {', '.join(valid_sources)}")
+    from .config import Config
+    from .pipeline import Pipeline
+    from .utils.eventloop import run_async
+
+    if source not in _VALID_SOURCES:
+        _console().print(f"[red]Invalid source: {source}[/red]")
+        _console().print(f"Valid sources: {', '.join(sorted(_VALID_SOURCES))}")
         raise typer.Exit(1)
 
     # Load config
-    if config_path and config_path.exists():
-        config = Config.from_yaml(config_path)
-    else:
-        config = Config.default()
+    config = Config.default()
+    if config_path:
+        try:
+            config = Config.from_yaml(config_path)
+        except FileNotFoundError:
+            pass
 
     if output_dir:
         config.pipeline.output_dir = output_dir
 
-    console.print(f"[bold]Collecting data from {source}[/bold]")
+    _console().print(f"[bold]Collecting data from {source}[/bold]")
 
     try:
         pipeline = Pipeline(config)
-        path = asyncio.run(pipeline.collect_source(source))
-        console.print(f"[green]Data collected to: {path}[/green]")
+        path = run_async(pipeline.collect_source(source))
+        _console().print(f"[green]Data collected to: {path}[/green]")
     except Exception as e:
-        console.print(f"[red]Collection failed: {e}[/red]")
+        _console().print(f"[red]Collection failed: {e}[/red]")
         raise typer.Exit(1)
 
 
@@ -216,15 +234,15 @@ def validate_config(
     Checks that the configuration file is valid YAML and conforms
     to the expected schema.
     """
-    if not config_path.exists():
-        console.print(f"[red]Config file not found: {config_path}[/red]")
-        raise typer.Exit(1)
+    from rich.table import Table
+
+    from .config import Config
 
     try:
         config = Config.from_yaml(config_path)
 
-        console.print("[green]Configuration is valid![/green]")
-        console.print()
+        _console().print("[green]Configuration is valid![/green]")
+        _console().print()
 
         # Show summary
         table = Table(title="Configuration Summary")
@@ -242,10 +260,13 @@ def validate_config(
         table.add_row("Export JSONL", str(config.export.jsonl))
         table.add_row("Export Parquet", str(config.export.parquet))
 
-        console.print(table)
+        _console().print(table)
 
+    except FileNotFoundError:
+        _console().print(f"[red]Config file not found: {config_path}[/red]")
+        raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Configuration error: {e}[/red]")
+        _console().print(f"[red]Configuration error: {e}[/red]")
         raise typer.Exit(1)
 
 
@@ -267,23 +288,27 @@ def init_config(
     Creates a new YAML configuration file with default values
     that can be customized for your needs.
     """
+    from .config import Config
+
     if output_path.exists() and not force:
-        console.print(f"[yellow]Config file already exists: {output_path}[/yellow]")
-        console.print("Use --force to overwrite")
+        _console().print(f"[yellow]Config file already exists: {output_path}[/yellow]")
+        _console().print("Use --force to overwrite")
         raise typer.Exit(1)
 
     config = Config.default()
     output_path.parent.mkdir(parents=True, exist_ok=True)
     config.to_yaml(output_path)
 
-    console.print(f"[green]Default config written to: {output_path}[/green]")
+    _console().print(f"[green]Default config written to: {output_path}[/green]")
 
 
 @app.command()
 def info() -> None:
     """Show information about available sources and their status."""
-    console.print("[bold]French Political Speeches Pipeline[/bold]")
-    console.print()
+    from rich.table import Table
+
+    _console().print("[bold]French Political Speeches Pipeline[/bold]")
+    _console().print()
 
     table = Table(title="Data Sources")
     table.add_column("Source", style="cyan")
@@ -316,12 +341,12 @@ def info() -> None:
         "Optional (disabled by default)",
     )
 
-    console.print(table)
+    _console().print(table)
 
-    console.print("\n[bold]Quick Start:[/bold]")
-    console.print("  political-speeches run                    # Run full pipeline")
-    console.print("  political-speeches run -s vie_publique    # Single source")
-    console.print("  political-speeches validate-config config/default.yaml")
+    _console().print("\n[bold]Quick Start:[/bold]")
+    _console().print("  political-speeches run                    # Run full pipeline")
+    _console().print("  political-speeches run -s vie_publique    # Single source")
+    _console().print("  political-speeches validate-config config/default.yaml")
 
 
 if __name__ == "__main__":
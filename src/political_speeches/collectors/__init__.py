@@ -1,10 +1,47 @@
-"""Data collectors for various sources."""
+"""Data collectors for various sources.
+
+Concrete collectors are imported on first use so that selecting one source
+does not pull in the dependencies of the others.
+"""
+
+import importlib
+from typing import Any
 
 from .base import BaseCollector
-from .vie_publique import ViePubliqueCollector
-from .senat import SenatCollector
-from .assemblee import AssembleeCollector
-from .europarl import EuroparlCollector
+
+# Source name -> collector class name; each source lives in a module of the same name
+_COLLECTOR_CLASSES = {
+    "vie_publique": "ViePubliqueCollector",
+    "senat": "SenatCollector",
+    "assemblee": "AssembleeCollector",
+    "europarl": "EuroparlCollector",
+}
+
+
+def get_collector(source_name: str) -> type[BaseCollector]:
+    """Return the collector class registered for a source, importing it if needed.
+
+    Args:
+        source_name: Name of the source (e.g., 'vie_publique', 'senat')
+
+    Returns:
+        Collector class
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    if source_name not in _COLLECTOR_CLASSES:
+        raise ValueError(f"Unknown source: {source_name}")
+    importlib.import_module(f".{source_name}", __name__)
+    return BaseCollector._registry[source_name]
+
+
+def __getattr__(name: str) -> Any:
+    for source_name, class_name in _COLLECTOR_CLASSES.items():
+        if class_name == name:
+            return get_collector(source_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseCollector",
@@ -12,4 +49,5 @@ __all__ = [
     "SenatCollector",
     "AssembleeCollector",
     "EuroparlCollector",
+    "get_collector",
 ]
@@ -5,10 +5,10 @@ For 2000-2010, this collector returns a stub with a warning.
 PDF/HTML + OCR/LLM parsing will be implemented in a future iteration.
 """
 
+import textwrap
 from pathlib import Path
 from typing import Optional
 
-from ..config import Config
 from ..utils.http import RateLimitedClient
 from ..utils.logging import get_logger
 from .base import BaseCollector
@@ -22,16 +22,7 @@ class AssembleeCollector(BaseCollector):
     returns empty results. Future versions will implement PDF/HTML parsing.
     """
 
-    def __init__(self, config: Config, output_dir: Path):
-        super().__init__(config, output_dir)
-        self.source_config = config.sources.assemblee
-        self.date_range = config.pipeline.date_range
-
-    def get_source_name(self) -> str:
-        return "assemblee"
-
-    def is_enabled(self) -> bool:
-        return self.source_config.enabled
+    source_name = "assemblee"
 
     async def collect(self) -> Path:
         """Attempt to collect Assemblee nationale data.
@@ -94,28 +85,40 @@ class AssembleeCollector(BaseCollector):
         # Create a notice file
         notice_path = self.output_dir / "DILA_COLLECTION_STUB.md"
         notice_path.write_text(
-            "# DILA Archive Collection\n\n"
-            "This is a stub implementation. Full collection of DILA XML archives\n"
-            "for Assemblee nationale debates (2011+) is not yet implemented.\n\n"
-            f"Base URL: {self.source_config.base_url}\n"
-            f"Date range requested: {self.date_range.start} to {self.date_range.end}\n"
+            textwrap.dedent(
+                f"""\
+                # DILA Archive Collection
+
+                This is a stub implementation. Full collection of DILA XML archives
+                for Assemblee nationale debates (2011+) is not yet implemented.
+
+                Base URL: {self.source_config.base_url}
+                Date range requested: {self.date_range.start} to {self.date_range.end}
+                """
+            )
         )
 
     def _write_stub_notice(self) -> None:
         """Write a notice file explaining the data gap."""
         notice_path = self.output_dir / "DATA_GAP_NOTICE.md"
         notice_path.write_text(
-            "# Assemblee Nationale Data Gap\n\n"
-            "## Summary\n"
-            "Structured XML data from DILA is only available from 2011 onwards.\n"
-            f"The requested date range ({self.date_range.start} to {self.date_range.end}) "
-            "predates this availability.\n\n"
-            "## Future Work\n"
-            "Historical data (2000-2010) can be obtained through:\n"
-            "1. PDF archives from the Assemblee nationale website\n"
-            "2. HTML scraping of historical pages\n"
-            "3. OCR processing using tools like docling\n"
-            "4. LLM-based text extraction\n\n"
-            "This functionality will be implemented in a future iteration.\n"
+            textwrap.dedent(
+                f"""\
+                # Assemblee Nationale Data Gap
+
+                ## Summary
+                Structured XML data from DILA is only available from 2011 onwards.
+                The requested date range ({self.date_range.start} to {self.date_range.end}) predates this availability.
+
+                ## Future Work
+                Historical data (2000-2010) can be obtained through:
+                1. PDF archives from the Assemblee nationale website
+                2. HTML scraping of historical pages
+                3. OCR processing using tools like docling
+                4. LLM-based text extraction
+
+                This functionality will be implemented in a future iteration.
+                """
+            )
         )
         self.logger.info(f"Data gap notice written to {notice_path}")
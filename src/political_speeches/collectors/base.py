@@ -1,8 +1,10 @@
 """Base collector interface."""
 
+import logging
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
 from ..config import Config
 from ..utils.logging import get_logger
@@ -13,8 +15,20 @@ class BaseCollector(ABC):
 
     Collectors are responsible for downloading raw data from their
     respective sources and storing it locally.
+
+    Concrete collectors set ``source_name`` to the matching attribute of
+    ``config.sources`` and are registered under that name on definition.
     """
 
+    source_name: ClassVar[str]
+    _registry: ClassVar[dict[str, type["BaseCollector"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        name = cls.__dict__.get("source_name")
+        if name:
+            BaseCollector._registry[name] = cls
+
     def __init__(self, config: Config, output_dir: Path):
         """Initialize the collector.
 
@@ -23,12 +37,18 @@ class BaseCollector(ABC):
             output_dir: Directory to store collected data
         """
         self.config = config
+        self.source_config = getattr(config.sources, self.source_name)
+        self.date_range = config.pipeline.date_range
         self.output_dir = output_dir
-        self.logger = get_logger()
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """Logger, resolved on first use rather than at construction."""
+        return get_logger()
+
     @abstractmethod
     async def collect(self) -> Path:
         """Download raw data to output_dir.
@@ -38,23 +58,21 @@ class BaseCollector(ABC):
         """
         pass
 
-    @abstractmethod
     def get_source_name(self) -> str:
         """Return the name of this source.
 
         Returns:
             Source name (e.g., 'vie_publique', 'senat')
         """
-        pass
+        return self.source_name
 
-    @abstractmethod
     def is_enabled(self) -> bool:
         """Check if this collector is enabled in config.
 
         Returns:
             True if enabled
         """
-        pass
+        return self.source_config.enabled
 
     def get_cache_path(self, filename: str) -> Path:
         """Get path for a cached file.
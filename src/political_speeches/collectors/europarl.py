@@ -4,9 +4,9 @@ This collector is DISABLED by default and serves as an expansion module
 for future implementation.
 """
 
+import textwrap
 from pathlib import Path
 
-from ..config import Config
 from ..utils.logging import get_logger
 from .base import BaseCollector
 
@@ -18,16 +18,7 @@ class EuroparlCollector(BaseCollector):
     This is an optional expansion module, disabled by default.
     """
 
-    def __init__(self, config: Config, output_dir: Path):
-        super().__init__(config, output_dir)
-        self.source_config = config.sources.europarl
-        self.date_range = config.pipeline.date_range
-
-    def get_source_name(self) -> str:
-        return "europarl"
-
-    def is_enabled(self) -> bool:
-        return self.source_config.enabled
+    source_name = "europarl"
 
     async def collect(self) -> Path:
         """Collect European Parliament data.
@@ -77,18 +68,25 @@ class EuroparlCollector(BaseCollector):
         # Create a notice file
         notice_path = self.output_dir / "EUROPARL_STUB.md"
         notice_path.write_text(
-            "# European Parliament Data Collection\n\n"
-            "## Status\n"
-            "This is a stub implementation. Full collection is not yet implemented.\n\n"
-            "## Data Source\n"
-            f"- Portal: {self.source_config.portal_url}\n"
-            f"- Filter: {self.source_config.filter_country} (French MEPs)\n"
-            f"- Date range: {self.date_range.start} to {self.date_range.end}\n\n"
-            "## Implementation Notes\n"
-            "When implemented, this collector will:\n"
-            "1. Query the EP Open Data SPARQL endpoint\n"
-            "2. Filter for French MEP interventions\n"
-            "3. Download debate transcripts (RDF/XML or JSON-LD)\n"
-            "4. Parse and convert to SpeechRecord format\n"
+            textwrap.dedent(
+                f"""\
+                # European Parliament Data Collection
+
+                ## Status
+                This is a stub implementation. Full collection is not yet implemented.
+
+                ## Data Source
+                - Portal: {self.source_config.portal_url}
+                - Filter: {self.source_config.filter_country} (French MEPs)
+                - Date range: {self.date_range.start} to {self.date_range.end}
+
+                ## Implementation Notes
+                When implemented, this collector will:
+                1. Query the EP Open Data SPARQL endpoint
+                2. Filter for French MEP interventions
+                3. Download debate transcripts (RDF/XML or JSON-LD)
+                4. Parse and convert to SpeechRecord format
+                """
+            )
         )
         self.logger.info(f"Stub notice written to {notice_path}")
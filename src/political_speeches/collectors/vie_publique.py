@@ -1,14 +1,17 @@
 """Collector for Vie-publique (DILA) discours publics."""
 
 import asyncio
-import json
-from datetime import date, datetime
+import mmap
+import os
+from datetime import date
 from pathlib import Path
 from typing import Iterator, Optional
 
 from ..config import Config
+from ..utils.dates import parse_iso_date, parse_speech_date, speech_date_value
 from ..utils.http import RateLimitedClient
 from ..utils.logging import get_logger
+from ..utils.manifest import iter_manifest
 from .base import BaseCollector
 
 
@@ -19,21 +22,14 @@ class ViePubliqueCollector(BaseCollector):
     and crawls individual speech pages for full text.
     """
 
+    source_name = "vie_publique"
     MANIFEST_FILENAME = "vp_discours.json"
 
     def __init__(self, config: Config, output_dir: Path):
         super().__init__(config, output_dir)
-        self.source_config = config.sources.vie_publique
-        self.date_range = config.pipeline.date_range
         self.pages_dir = output_dir / "pages"
         self.pages_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_source_name(self) -> str:
-        return "vie_publique"
-
-    def is_enabled(self) -> bool:
-        return self.source_config.enabled
-
     async def collect(self) -> Path:
         """Download manifest and crawl speech pages.
 
@@ -82,35 +78,63 @@ class ViePubliqueCollector(BaseCollector):
 
         return manifest_path
 
-    def _load_and_filter_manifest(self, manifest_path: Path) -> list[dict]:
+    def _load_and_filter_manifest(
+        self, manifest_path: Path
+    ) -> list[tuple[str, str, date]]:
         """Load manifest and filter by date range.
 
+        The manifest is streamed and each entry in the date range is reduced
+        to its ID, page URL and date in the same pass, so the raw
+        dictionaries are never kept.
+
         Args:
             manifest_path: Path to manifest file
 
         Returns:
-            List of speech entries in date range
+            List of (speech_id, url, date) tuples in date range
         """
         self.logger.info("Loading manifest...")
 
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            # The manifest is a large JSON array
-            data = json.load(f)
-
-        # Handle both array and object formats
-        if isinstance(data, dict):
-            speeches = data.get("discours", data.get("data", []))
-        else:
-            speeches = data
-
-        self.logger.info(f"Loaded {len(speeches)} total speeches from manifest")
+        # ISO dates order the same as strings, so most out-of-range entries
+        # are rejected by a string comparison before any date is built;
+        # values in another shape are left to the parsed-date check
+        start_iso = self.date_range.start.isoformat()
+        end_iso = self.date_range.end.isoformat()
 
-        # Filter by date range
+        total = 0
+        missing_id = 0
         filtered = []
-        for speech in speeches:
-            speech_date = self._parse_date(speech)
-            if speech_date and self.date_range.start <= speech_date <= self.date_range.end:
-                filtered.append(speech)
+        # Map the file so the parser reads straight from the page cache
+        with open(manifest_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            for speech in iter_manifest(mm):
+                total += 1
+                value = speech_date_value(speech)
+                if not value:
+                    continue
+                if (
+                    value[4:5] == "-"
+                    and value[7:8] == "-"
+                    and not (start_iso <= value[:10] <= end_iso)
+                ):
+                    continue
+                speech_date = parse_iso_date(value)
+                if speech_date is None:
+                    continue
+                if not (self.date_range.start <= speech_date <= self.date_range.end):
+                    continue
+                entry = self._prepare(speech, speech_date)
+                if entry is None:
+                    missing_id += 1
+                else:
+                    filtered.append(entry)
+
+        self.logger.info(f"Loaded {total} total speeches from manifest")
+        if missing_id:
+            self.logger.warning(f"Skipped {missing_id} speeches without an ID")
 
         return filtered
 
@@ -123,127 +147,116 @@ class ViePubliqueCollector(BaseCollector):
         Returns:
             Date object or None if unparseable
         """
-        # Try various date field names - prononciation is the delivery date in current manifest
-        date_str = (
-            speech.get("prononciation")
-            or speech.get("date")
-            or speech.get("dateDiscours")
-            or speech.get("date_discours")
-            or speech.get("mise_en_ligne")
-        )
-        if not date_str:
-            return None
-
-        try:
-            # Try ISO format first
-            if "T" in str(date_str):
-                return datetime.fromisoformat(str(date_str).replace("Z", "+00:00")).date()
-            # Try simple date format
-            return datetime.strptime(str(date_str)[:10], "%Y-%m-%d").date()
-        except (ValueError, TypeError):
-            return None
+        return parse_speech_date(speech)
 
     async def _crawl_pages(
-        self, client: RateLimitedClient, speeches: list[dict]
+        self, client: RateLimitedClient, speeches: list[tuple[str, str, date]]
     ) -> None:
         """Crawl individual speech pages for full text.
 
+        Up to ``max_workers * 4`` pages are fetched concurrently; the client's
+        rate limiter still spaces out the requests themselves.
+
         Args:
             client: HTTP client
-            speeches: List of speech entries to crawl
+            speeches: List of (speech_id, url, date) tuples to crawl
         """
         self.logger.info(f"Crawling {len(speeches)} speech pages...")
 
-        crawled = 0
-        skipped = 0
-        errors = 0
-
-        for i, speech in enumerate(speeches):
-            speech_id = self._get_speech_id(speech)
-            if not speech_id:
-                errors += 1
-                continue
+        counts = {"crawled": 0, "cached": 0, "errors": 0}
+        semaphore = asyncio.Semaphore(self.config.pipeline.max_workers * 4)
 
+        async def _fetch_one(speech_id: str, url: str) -> None:
             page_path = self.pages_dir / f"{speech_id}.html"
 
             # Skip if already cached
             if page_path.exists():
-                skipped += 1
-                continue
-
-            # Build URL
-            url = self._build_speech_url(speech)
-            if not url:
-                errors += 1
-                continue
+                counts["cached"] += 1
+                return
 
             try:
-                html = await client.get_text(url)
-                page_path.write_text(html, encoding="utf-8")
-                crawled += 1
-
-                if (crawled + skipped) % 100 == 0:
-                    self.logger.info(
-                        f"Progress: {crawled + skipped}/{len(speeches)} "
-                        f"(crawled: {crawled}, cached: {skipped}, errors: {errors})"
-                    )
+                async with semaphore:
+                    response = await client.get(url)
+
+                # Pages are stored as UTF-8, which is how the site serves them,
+                # so the body is normally written as received without a decode
+                # and re-encode; other charsets are transcoded
+                charset = (response.charset_encoding or "utf-8").lower()
+                if charset in ("utf-8", "utf8"):
+                    body = response.content
+                else:
+                    body = response.text.encode("utf-8")
+
+                # Write off the event loop so other fetches keep progressing
+                await asyncio.to_thread(page_path.write_bytes, body)
             except Exception as e:
                 self.logger.warning(f"Failed to crawl {url}: {e}")
-                errors += 1
+                counts["errors"] += 1
+                return
+
+            counts["crawled"] += 1
+
+            done = counts["crawled"] + counts["cached"]
+            if done % 100 == 0:
+                self.logger.info(
+                    f"Progress: {done}/{len(speeches)} "
+                    f"(crawled: {counts['crawled']}, cached: {counts['cached']}, "
+                    f"errors: {counts['errors']})"
+                )
+
+        # A failing page must not cancel the crawl or escape collect(), so any
+        # exception _fetch_one did not handle is counted as a page error
+        results = await asyncio.gather(
+            *(_fetch_one(speech_id, url) for speech_id, url, _ in speeches),
+            return_exceptions=True,
+        )
+        for (_, url, _), result in zip(speeches, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to crawl {url}: {result}")
+                counts["errors"] += 1
 
         self.logger.info(
-            f"Crawling complete: {crawled} new, {skipped} cached, {errors} errors"
+            f"Crawling complete: {counts['crawled']} new, {counts['cached']} cached, "
+            f"{counts['errors']} errors"
         )
 
-    def _get_speech_id(self, speech: dict) -> Optional[str]:
-        """Extract speech ID from entry.
+    def _prepare(
+        self, speech: dict, speech_date: date
+    ) -> Optional[tuple[str, str, date]]:
+        """Extract the speech ID and page URL from a manifest entry.
 
         Args:
             speech: Speech dictionary
+            speech_date: Already parsed speech date
 
         Returns:
-            Speech ID or None
+            (speech_id, url, date) tuple, or None if no ID can be found
         """
-        # Try various ID fields
-        for field in ["id", "identifiant", "uid", "reference"]:
-            if field in speech and speech[field]:
-                return str(speech[field])
-
-        # Extract from URL if available
-        url = speech.get("url") or speech.get("lien")
-        if url:
-            # Extract ID from URL like /discours/123456-title
-            parts = url.rstrip("/").split("/")
-            if parts:
-                last = parts[-1]
-                if "-" in last:
-                    return last.split("-")[0]
-                return last
-
-        return None
-
-    def _build_speech_url(self, speech: dict) -> Optional[str]:
-        """Build full URL for a speech page.
-
-        Args:
-            speech: Speech dictionary
+        link = speech.get("url") or speech.get("lien")
+
+        # Try various ID fields, then extract from a URL like /discours/123456-title
+        speech_id = None
+        for field in ("id", "identifiant", "uid", "reference"):
+            value = speech.get(field)
+            if value:
+                speech_id = str(value)
+                break
+        else:
+            if link:
+                last = link.rstrip("/").rsplit("/", 1)[-1]
+                speech_id = last.split("-", 1)[0]
 
-        Returns:
-            Full URL or None
-        """
-        # Check for direct URL
-        url = speech.get("url") or speech.get("lien")
-        if url:
-            if url.startswith("http"):
-                return url
-            return f"{self.source_config.base_url}{url}"
+        if not speech_id:
+            return None
 
-        # Build from ID
-        speech_id = self._get_speech_id(speech)
-        if speech_id:
-            return f"{self.source_config.base_url}/discours/{speech_id}"
+        if not link:
+            url = f"{self.source_config.base_url}/discours/{speech_id}"
+        elif link.startswith("http"):
+            url = link
+        else:
+            url = f"{self.source_config.base_url}{link}"
 
-        return None
+        return speech_id, url, speech_date
 
     def iter_cached_pages(self) -> Iterator[tuple[str, Path]]:
         """Iterate over cached HTML pages.
@@ -251,6 +264,7 @@ class ViePubliqueCollector(BaseCollector):
         Yields:
             Tuples of (speech_id, page_path)
         """
-        for page_path in self.pages_dir.glob("*.html"):
-            speech_id = page_path.stem
-            yield speech_id, page_path
+        with os.scandir(self.pages_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".html"):
+                    yield entry.name[:-5], Path(entry.path)
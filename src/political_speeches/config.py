@@ -1,13 +1,27 @@
 """Configuration management for the political speeches pipeline."""
 
+import copy
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=4)
+def _load_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file, cached on its path and modification time."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class DateRange(BaseModel):
     """Date range for filtering speeches."""
@@ -22,9 +36,36 @@ class HttpConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     retry_backoff: float = Field(default=2.0, description="Exponential backoff multiplier")
+    retry_jitter: Literal["full", "decorrelated"] = Field(
+        default="full", description="How retry waits are randomized"
+    )
     rate_limit_delay: float = Field(
         default=1.0, description="Delay between requests in seconds"
     )
+    rate_limit_burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may be sent back to back before "
+        "rate_limit_delay applies",
+    )
+    http2: bool = Field(
+        default=True, description="Use HTTP/2 when the h2 package is installed"
+    )
+    max_connections: int = Field(
+        default=50, description="Maximum open connections per client"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle connection is kept open for reuse",
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory caching GET responses for revalidation; "
+        "None disables the cache",
+    )
+    download_chunk_size: int = Field(
+        default=128 * 1024, gt=0, description="Bytes read per chunk when downloading"
+    )
 
 
 class ViePubliqueConfig(BaseModel):
@@ -79,10 +120,21 @@ class ProcessingConfig(BaseModel):
     strip_html: bool = True
     remove_boilerplate: bool = True
     min_text_length: int = Field(default=100, description="Minimum text length to keep")
-    dedupe_hash_algorithm: Literal["xxhash64", "sha256"] = "xxhash64"
+    # xxh3 is the fastest; xxhash64 reproduces hashes of earlier runs
+    dedupe_hash_algorithm: Literal["xxh3", "xxhash64", "sha256"] = "xxh3"
     dedupe_fields: list[str] = Field(
         default_factory=lambda: ["text"], description="Fields to hash for deduplication"
     )
+    # roaring stores seen hashes in a compressed bitmap (needs pyroaring) and
+    # does not record which source each hash came from
+    dedupe_backend: Literal["set", "roaring"] = "set"
+    near_dup_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Jaccard similarity above which records count as near "
+        "duplicates (requires datasketch); None for exact matching only",
+    )
     exclude_speaker_roles: list[str] = Field(
         default_factory=list, description="Speaker roles to exclude from output"
     )
@@ -120,9 +172,10 @@ class Config(BaseSettings):
     @classmethod
     def from_yaml(cls, path: Path) -> "Config":
         """Load configuration from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls(**data) if data else cls()
+        path = Path(path)
+        data = _load_yaml(str(path.resolve()), path.stat().st_mtime_ns)
+        # Callers mutate the returned config, so never hand out the cached data
+        return cls(**copy.deepcopy(data)) if data else cls()
 
     @classmethod
     def default(cls) -> "Config":
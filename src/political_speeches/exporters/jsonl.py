@@ -1,12 +1,32 @@
 """JSONL exporter."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, List
+from typing import BinaryIO, Iterator, List, Optional
+
+import orjson
 
 from ..models import SpeechRecord
 from ..utils.logging import get_logger
 
 
+def encode_record(record: SpeechRecord) -> bytes:
+    """Encode a record as one JSONL line.
+
+    Serializes the model's field values directly with orjson, which handles
+    date and datetime natively, instead of going through pydantic's
+    serializer for every record. None fields are omitted.
+
+    Args:
+        record: Speech record
+
+    Returns:
+        UTF-8 JSON bytes terminated by a newline
+    """
+    data = {k: v for k, v in record.__dict__.items() if v is not None}
+    return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+
+
 class JSONLExporter:
     """Exports speech records to JSONL format.
 
@@ -14,9 +34,51 @@ class JSONLExporter:
     This format is efficient for streaming and line-by-line processing.
     """
 
+    # Records are encoded in batches and written with a single write() call
+    BATCH_SIZE = 1024
+    BUFFER_SIZE = 1 << 20
+
     def __init__(self):
         self.logger = get_logger()
 
+    def _write_records(self, records: Iterator[SpeechRecord], f: BinaryIO) -> int:
+        """Encode records and write them to an open file in batches.
+
+        Each batch is handed to a writer thread while the next one is being
+        encoded; file writes release the GIL, so encoding and disk I/O overlap.
+        At most one batch is in flight, keeping output order and memory bounded.
+
+        Args:
+            records: Iterator of speech records
+            f: File opened in binary mode
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        batch: list[bytes] = []
+        pending: Optional[Future] = None
+
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for record in records:
+                batch.append(encode_record(record))
+                if len(batch) >= self.BATCH_SIZE:
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(f.write, b"".join(batch))
+                    count += len(batch)
+                    batch.clear()
+                    self.logger.debug(f"Exported {count} records to JSONL")
+
+            if pending is not None:
+                pending.result()
+
+        if batch:
+            f.write(b"".join(batch))
+            count += len(batch)
+
+        return count
+
     def export(
         self,
         records: Iterator[SpeechRecord],
@@ -33,16 +95,8 @@ class JSONLExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        count = 0
-        with open(output_path, "w", encoding="utf-8") as f:
-            for record in records:
-                # Convert to JSON with proper date handling
-                json_str = record.model_dump_json(exclude_none=True)
-                f.write(json_str + "\n")
-                count += 1
-
-                if count % 1000 == 0:
-                    self.logger.debug(f"Exported {count} records to JSONL")
+        with open(output_path, "wb", buffering=self.BUFFER_SIZE) as f:
+            count = self._write_records(records, f)
 
         self.logger.info(f"Exported {count} records to {output_path}")
         return count
@@ -79,12 +133,8 @@ class JSONLExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        count = 0
-        with open(output_path, "a", encoding="utf-8") as f:
-            for record in records:
-                json_str = record.model_dump_json(exclude_none=True)
-                f.write(json_str + "\n")
-                count += 1
+        with open(output_path, "ab", buffering=self.BUFFER_SIZE) as f:
+            count = self._write_records(records, f)
 
         self.logger.info(f"Appended {count} records to {output_path}")
         return count
@@ -93,17 +143,17 @@ class JSONLExporter:
 def read_jsonl(path: Path) -> Iterator[SpeechRecord]:
     """Read speech records from a JSONL file.
 
+    Each line is validated straight from JSON bytes by pydantic-core,
+    without building an intermediate dict in Python.
+
     Args:
         path: Path to JSONL file
 
     Yields:
         SpeechRecord objects
     """
-    import json
-
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
-                data = json.loads(line)
-                yield SpeechRecord(**data)
+                yield SpeechRecord.model_validate_json(line)
@@ -1,15 +1,16 @@
 """Manifest generator for pipeline runs."""
 
-import hashlib
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
+import orjson
+
+from .._version import __version__
 from ..config import Config
 from ..models import ManifestRecord, SourceStats
-from ..utils.hashing import compute_file_checksum
+from ..utils.hashing import compute_file_checksum, compute_hash
 from ..utils.logging import get_logger
 
 
@@ -38,19 +39,19 @@ class ManifestGenerator:
         Returns:
             Short hex hash of config
         """
-        config_json = json.dumps(
+        config_json = orjson.dumps(
             self.config.model_dump(mode="json"),
-            sort_keys=True,
-            default=str,
+            option=orjson.OPT_SORT_KEYS,
         )
-        full_hash = hashlib.sha256(config_json.encode()).hexdigest()
-        return full_hash[:16]  # Short hash
+        # Identification only, so a fast non-cryptographic hash is enough
+        return compute_hash(config_json, "xxhash64")
 
     def generate(
         self,
         source_stats: dict[str, SourceStats],
         output_dir: Path,
         errors: Optional[list[str]] = None,
+        run_timestamp: Optional[datetime] = None,
     ) -> ManifestRecord:
         """Generate a manifest record.
 
@@ -58,6 +59,7 @@ class ManifestGenerator:
             source_stats: Statistics per source
             output_dir: Directory containing output files
             errors: List of error messages
+            run_timestamp: Start time of the run; defaults to now
 
         Returns:
             ManifestRecord object
@@ -76,7 +78,7 @@ class ManifestGenerator:
 
         manifest = ManifestRecord(
             run_id=f"run_{uuid4().hex[:8]}",
-            run_timestamp=datetime.utcnow(),
+            run_timestamp=run_timestamp or datetime.utcnow(),
             config_hash=self.compute_config_hash(),
             date_range_start=self.config.pipeline.date_range.start,
             date_range_end=self.config.pipeline.date_range.end,
@@ -112,6 +114,7 @@ class ManifestGenerator:
         source_stats: dict[str, SourceStats],
         output_dir: Path,
         errors: Optional[list[str]] = None,
+        run_timestamp: Optional[datetime] = None,
     ) -> ManifestRecord:
         """Generate manifest and write to file.
 
@@ -119,11 +122,12 @@ class ManifestGenerator:
             source_stats: Statistics per source
             output_dir: Directory containing output files
             errors: List of error messages
+            run_timestamp: Start time of the run; defaults to now
 
         Returns:
             ManifestRecord object
         """
-        manifest = self.generate(source_stats, output_dir, errors)
+        manifest = self.generate(source_stats, output_dir, errors, run_timestamp)
         self.write(manifest, output_dir / "manifest.json")
         return manifest
 
@@ -183,7 +187,7 @@ This document describes the data sources used in the French Political Speeches d
 ## Processing
 
 - **Unicode Normalization**: NFC
-- **Deduplication**: Based on text content hash (xxhash64)
+- **Deduplication**: Based on text content hash ({dedupe_hash_algorithm})
 - **Minimum Text Length**: 100 characters
 
 ## Citation
@@ -219,7 +223,7 @@ Generated by: political-speeches pipeline v{version}
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        content = self.TEMPLATE.format(
+        fields = dict(
             start_date=self.config.pipeline.date_range.start.isoformat(),
             end_date=self.config.pipeline.date_range.end.isoformat(),
             vie_publique_count=source_stats.get("vie_publique", SourceStats()).deduplicated,
@@ -227,9 +231,24 @@ Generated by: political-speeches pipeline v{version}
             assemblee_count=source_stats.get("assemblee", SourceStats()).deduplicated,
             europarl_status="Enabled" if self.config.sources.europarl.enabled else "Disabled",
             europarl_count=source_stats.get("europarl", SourceStats()).deduplicated,
-            version="0.1.0",
+            dedupe_hash_algorithm=self.config.processing.dedupe_hash_algorithm,
+            version=__version__,
+        )
+
+        # The inputs hash is embedded in the file; when it matches, only the
+        # generation date would change, so the existing file is kept as is
+        marker = f"<!-- inputs: {compute_hash(repr(sorted(fields.items())))} -->\n"
+        try:
+            if output_path.read_text(encoding="utf-8").endswith(marker):
+                self.logger.info(f"SOURCES.md is up to date: {output_path}")
+                return
+        except FileNotFoundError:
+            pass
+
+        content = self.TEMPLATE.format(
+            **fields,
             generation_date=datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC"),
         )
 
-        output_path.write_text(content, encoding="utf-8")
+        output_path.write_text(content + "\n" + marker, encoding="utf-8")
         self.logger.info(f"SOURCES.md written to {output_path}")
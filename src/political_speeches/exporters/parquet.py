@@ -1,13 +1,47 @@
 """Parquet exporter using Polars."""
 
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import TypeAdapter
 
-from ..models import SpeechRecord
+from ..models import RecordBatch, SpeechRecord
 from ..utils.logging import get_logger
 
+# Arrow schema matching SpeechRecord, so every streamed batch has the same
+# columns regardless of which optional fields are set
+ARROW_SCHEMA = pa.schema(
+    [
+        ("source", pa.string()),
+        ("source_id", pa.string()),
+        ("date", pa.date32()),
+        ("speaker", pa.string()),
+        ("title", pa.string()),
+        ("text", pa.string()),
+        ("source_url", pa.string()),
+        ("lang", pa.string()),
+        ("retrieved_at", pa.timestamp("us")),
+        ("license", pa.string()),
+        ("speaker_role", pa.string()),
+        ("speech_type", pa.string()),
+        ("session_id", pa.string()),
+        ("text_hash", pa.string()),
+        ("cleaned_at", pa.timestamp("us")),
+    ]
+)
+
+POLARS_SCHEMA = pl.from_arrow(ARROW_SCHEMA.empty_table()).schema
+
+# Dumps or validates a whole batch of records in one pydantic-core call
+RECORDS_ADAPTER = TypeAdapter(list[SpeechRecord])
+
+# Codecs that accept a compression level; the others reject one
+LEVELED_CODECS = frozenset({"zstd", "gzip", "brotli"})
+
 
 class ParquetExporter:
     """Exports speech records to Parquet format.
@@ -16,13 +50,29 @@ class ParquetExporter:
     Parquet is ideal for analytical queries and data science workflows.
     """
 
-    def __init__(self, compression: str = "zstd"):
+    def __init__(
+        self,
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3,
+        row_group_size: int = 256_000,
+        statistics: bool = False,
+    ):
         """Initialize the exporter.
 
         Args:
             compression: Compression algorithm (zstd, snappy, gzip, lz4, none)
+            compression_level: Codec level, or None for the codec default;
+                ignored by codecs without levels (snappy, lz4, none)
+            row_group_size: Maximum rows per row group; larger groups give
+                longer contiguous compressed blocks and less metadata
+            statistics: Write per-column min/max statistics
         """
         self.compression = compression
+        self.compression_level = (
+            compression_level if compression.lower() in LEVELED_CODECS else None
+        )
+        self.row_group_size = row_group_size
+        self.statistics = statistics
         self.logger = get_logger()
 
     def export(
@@ -45,20 +95,20 @@ class ParquetExporter:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert records to list of dicts
-        data = []
-        for record in records:
-            # Use model_dump to get serializable dict
-            d = record.model_dump(mode="json", exclude_none=True)
-            data.append(d)
+        # Python-mode dumps keep date/datetime objects, which Polars stores
+        # natively instead of round-tripping through ISO strings
+        data = RECORDS_ADAPTER.dump_python(records)
 
-        # Create Polars DataFrame
-        df = pl.DataFrame(data)
+        # Create Polars DataFrame with a fixed schema (no dtype inference)
+        df = pl.DataFrame(data, schema=POLARS_SCHEMA)
 
         # Write to Parquet
         df.write_parquet(
             output_path,
             compression=self.compression,
+            compression_level=self.compression_level,
+            row_group_size=self.row_group_size,
+            statistics=self.statistics,
         )
 
         self.logger.info(
@@ -76,41 +126,73 @@ class ParquetExporter:
     ) -> int:
         """Export records to Parquet with streaming/batching.
 
-        For very large datasets, processes records in batches to
-        manage memory usage.
+        For very large datasets, writes one row group per batch through a
+        pyarrow ParquetWriter so only ``batch_size`` records are held in
+        memory at a time.
 
         Args:
             records: Iterator of speech records
             output_path: Path to output file
             batch_size: Number of records per batch
 
+        Returns:
+            Total number of records exported
+        """
+        records = iter(records)
+        batches = (
+            RecordBatch.from_records(chunk)
+            for chunk in iter(lambda: list(islice(records, batch_size)), [])
+        )
+        return self.export_batches(batches, output_path)
+
+    def export_batches(
+        self,
+        batches: Iterator[RecordBatch],
+        output_path: Path,
+    ) -> int:
+        """Export column-oriented record batches to Parquet.
+
+        Each batch's columns are handed to Arrow as a whole, without a
+        per-record conversion.
+
+        Args:
+            batches: Iterator of record batches
+            output_path: Path to output file
+
         Returns:
             Total number of records exported
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        all_data = []
+        writer: Optional[pq.ParquetWriter] = None
         total_count = 0
 
-        for record in records:
-            d = record.model_dump(mode="json", exclude_none=True)
-            all_data.append(d)
-            total_count += 1
-
-            if len(all_data) >= batch_size:
+        try:
+            for batch in batches:
+                if not batch.n:
+                    continue
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        output_path,
+                        ARROW_SCHEMA,
+                        compression=self.compression,
+                        compression_level=self.compression_level,
+                        write_statistics=self.statistics,
+                    )
+                writer.write_table(
+                    pa.Table.from_pydict(batch.columns, schema=ARROW_SCHEMA),
+                    row_group_size=self.row_group_size,
+                )
+                total_count += batch.n
                 self.logger.debug(f"Processed {total_count} records...")
+        finally:
+            if writer is not None:
+                writer.close()
 
-        if not all_data:
+        if total_count == 0:
             self.logger.warning("No records to export to Parquet")
             return 0
 
-        # Create DataFrame and write
-        df = pl.DataFrame(all_data)
-        df.write_parquet(
-            output_path,
-            compression=self.compression,
-        )
-
         self.logger.info(
             f"Exported {total_count} records to {output_path}"
         )
@@ -130,16 +212,22 @@ def read_parquet(path: Path) -> pl.DataFrame:
     return pl.read_parquet(path)
 
 
-def parquet_to_records(path: Path) -> Iterator[SpeechRecord]:
+def parquet_to_records(
+    path: Path, batch_size: int = 10000
+) -> Iterator[SpeechRecord]:
     """Read Parquet file and yield SpeechRecord objects.
 
+    Rows are validated a slice at a time with a single pydantic-core call
+    instead of constructing each model from Python keyword arguments.
+
     Args:
         path: Path to Parquet file
+        batch_size: Number of rows validated per call
 
     Yields:
         SpeechRecord objects
     """
     df = pl.read_parquet(path)
 
-    for row in df.iter_rows(named=True):
-        yield SpeechRecord(**row)
+    for chunk in df.iter_slices(n_rows=batch_size):
+        yield from RECORDS_ADAPTER.validate_python(chunk.to_dicts())
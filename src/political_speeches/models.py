@@ -1,10 +1,13 @@
 """Data models for the political speeches pipeline."""
 
 import datetime as dt
-from typing import Literal, Optional
+from dataclasses import dataclass
+from typing import Any, Iterable, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from ._version import __version__
+
 
 class SpeechRecord(BaseModel):
     """Unified speech record across all sources."""
@@ -38,11 +41,94 @@ class SpeechRecord(BaseModel):
     text_hash: Optional[str] = Field(None, description="Hash of cleaned text for deduplication")
     cleaned_at: Optional[dt.datetime] = Field(None, description="When text was cleaned")
 
-    model_config = {"extra": "ignore"}
+    # Every construction site passes known fields only, so unknown keys are
+    # a bug rather than something to filter out silently
+    model_config = {"extra": "forbid", "frozen": True}
+
+    @classmethod
+    def from_validated(cls, **values: Any) -> "SpeechRecord":
+        """Build a record from values already of the right type.
+
+        Skips pydantic validation (defaults are still applied), for parsers
+        that construct every field themselves. Data from external input
+        should go through the regular constructor instead.
+
+        Args:
+            **values: Field values
+
+        Returns:
+            SpeechRecord object
+        """
+        return cls.model_construct(**values)
+
+    def replace(self, **changes: Any) -> "SpeechRecord":
+        """Return a copy of the record with some fields changed.
+
+        Records are frozen, so pipeline stages derive new ones instead of
+        mutating them. Unlike ``model_copy`` this only copies the field
+        dict, skipping the generic deep/private/extra handling; like it,
+        the changed values are not validated.
+
+        Args:
+            **changes: Field values to replace
+
+        Returns:
+            New SpeechRecord object
+        """
+        copied = self.__class__.__new__(self.__class__)
+        object.__setattr__(copied, "__dict__", {**self.__dict__, **changes})
+        object.__setattr__(
+            copied,
+            "__pydantic_fields_set__",
+            self.__pydantic_fields_set__.union(changes),
+        )
+        object.__setattr__(copied, "__pydantic_extra__", None)
+        object.__setattr__(copied, "__pydantic_private__", None)
+        return copied
+
+
+class RecordBatch:
+    """Column-oriented batch of speech records.
+
+    Holds one list per SpeechRecord field, so consumers such as the Parquet
+    writer can take whole columns instead of walking records one by one.
+    """
+
+    __slots__ = ("columns", "n")
+
+    def __init__(self, columns: dict[str, list[Any]], n: int):
+        self.columns = columns
+        self.n = n
+
+    def __len__(self) -> int:
+        return self.n
+
+    @classmethod
+    def from_records(cls, records: Iterable[SpeechRecord]) -> "RecordBatch":
+        """Transpose records into columns.
+
+        Args:
+            records: Speech records
+
+        Returns:
+            RecordBatch with one column per field
+        """
+        records = list(records)
+        columns = {
+            name: [getattr(record, name) for record in records]
+            for name in SpeechRecord.model_fields
+        }
+        return cls(columns, len(records))
+
 
+@dataclass(slots=True)
+class SourceStats:
+    """Statistics for a single source.
 
-class SourceStats(BaseModel):
-    """Statistics for a single source."""
+    A plain slotted dataclass rather than a model: the pipeline bumps these
+    counters once per record, and pydantic still validates and serializes
+    it as part of ManifestRecord.
+    """
 
     collected: int = 0
     parsed: int = 0
@@ -78,6 +164,6 @@ class ManifestRecord(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
     # Pipeline version
-    pipeline_version: str = "0.1.0"
+    pipeline_version: str = __version__
 
     model_config = {"extra": "ignore"}
@@ -4,17 +4,30 @@ NOTE: This is a skeleton implementation for DILA XML archives (2011+).
 For 2000-2010, no structured data is available.
 """
 
-from datetime import date
+import os
+import stat
+import sys
+from datetime import date, datetime
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import ClassVar, Iterator, Optional
 
 from lxml import etree
 
 from ..config import Config
 from ..models import SpeechRecord
+from ..utils.dates import parse_iso_date
+from ..utils.fs import iter_files
 from ..utils.logging import get_logger
 from .base import BaseParser
 
+# Values identical for every Assemblee record, shared by all of them
+_CONSTANT_FIELDS = {
+    "source": sys.intern("assemblee"),
+    "lang": sys.intern("fr"),
+    "license": sys.intern("Licence Ouverte"),
+    "speech_type": sys.intern("intervention"),
+}
+
 
 class AssembleeXMLParser(BaseParser):
     """Parser for Assemblee nationale DILA XML files.
@@ -23,9 +36,37 @@ class AssembleeXMLParser(BaseParser):
     format would be implemented here once data is collected.
     """
 
-    def __init__(self, config: Config):
-        super().__init__(config)
+    # Elements that may hold the session date
+    SESSION_DATE_TAGS = ("dateSeance", "date", "jour")
+
+    # Shared by every iterparse call; entity resolution and ID collection
+    # are not needed and would otherwise run for each document
+    ITERPARSE_OPTIONS: ClassVar[dict[str, bool]] = {
+        "recover": True,
+        "remove_blank_text": True,
+        "resolve_entities": False,
+        "collect_ids": False,
+        "huge_tree": False,
+    }
+
+    # Compiled once; each returns the first matching descendant, if any
+    _X_ORATEUR: ClassVar[etree.XPath] = etree.XPath("(.//orateur)[1]")
+    _X_NOM: ClassVar[etree.XPath] = etree.XPath("(.//nom)[1]")
+    _X_QUALITE: ClassVar[etree.XPath] = etree.XPath("(.//qualite)[1]")
+    _X_TEXTE: ClassVar[etree.XPath] = etree.XPath("(.//texte)[1]")
+
+    NOTICE_FILENAME = "DATA_GAP_NOTICE.md"
+    DEBATE_URL = "https://www.assemblee-nationale.fr/dyn/debats"
+
+    # Below this many files, process startup costs more than it saves
+    PARALLEL_MIN_FILES = 8
+
+    def __init__(self, config: Config, retrieved_at: Optional[datetime] = None):
+        super().__init__(config, retrieved_at)
         self.date_range = config.pipeline.date_range
+        # Range bounds as day ordinals, compared as plain ints
+        self._range_lo = self.date_range.start.toordinal()
+        self._range_hi = self.date_range.end.toordinal()
 
     def get_source_name(self) -> str:
         return "assemblee"
@@ -39,24 +80,27 @@ class AssembleeXMLParser(BaseParser):
         Yields:
             SpeechRecord objects
         """
-        if not source_path.exists():
+        try:
+            st = os.stat(source_path)
+        except FileNotFoundError:
             self.logger.warning(f"Source path does not exist: {source_path}")
             return
 
-        # Check for stub notice
-        notice_path = source_path / "DATA_GAP_NOTICE.md"
-        if notice_path.exists():
-            self.logger.info(
-                "Assemblee data gap notice found. "
-                "No structured data available for 2000-2010."
-            )
-            return
-
-        # Find XML files
-        if source_path.is_file():
+        # Find XML files, checking for the stub notice in the same walk
+        if stat.S_ISREG(st.st_mode):
             xml_files = [source_path]
         else:
-            xml_files = list(source_path.rglob("*.xml"))
+            notice_path = os.path.join(source_path, self.NOTICE_FILENAME)
+            xml_files = []
+            for path in iter_files(source_path, (".xml", self.NOTICE_FILENAME)):
+                if path == notice_path:
+                    self.logger.info(
+                        "Assemblee data gap notice found. "
+                        "No structured data available for 2000-2010."
+                    )
+                    return
+                if path.endswith(".xml"):
+                    xml_files.append(Path(path))
 
         if not xml_files:
             self.logger.info("No Assemblee XML files found")
@@ -64,11 +108,27 @@ class AssembleeXMLParser(BaseParser):
 
         self.logger.info(f"Parsing {len(xml_files)} Assemblee XML files")
 
-        for xml_file in xml_files:
-            try:
-                yield from self._parse_xml_file(xml_file)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse {xml_file}: {e}")
+        workers = min(self.config.pipeline.max_workers, len(xml_files))
+        if workers < 2 or len(xml_files) < self.PARALLEL_MIN_FILES:
+            for xml_file in xml_files:
+                yield from self._parse_file_safe(xml_file)
+            return
+
+        # Files are parsed in worker processes, in file order, so the output
+        # (and therefore deduplication) stays deterministic
+        for rows in self._map_files(_parse_file_worker, xml_files, workers):
+            for row in rows:
+                # Unpickled strings are fresh copies; share the constants again
+                row.update(_CONSTANT_FIELDS, retrieved_at=self.retrieved_at)
+                row["speaker"] = sys.intern(row["speaker"])
+                yield SpeechRecord.from_validated(**row)
+
+    def _parse_file_safe(self, xml_path: Path) -> Iterator[SpeechRecord]:
+        """Parse one file, logging instead of raising on failure."""
+        try:
+            yield from self._parse_xml_file(xml_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse {xml_path}: {e}")
 
     def _parse_xml_file(self, xml_path: Path) -> Iterator[SpeechRecord]:
         """Parse a single DILA XML file.
@@ -76,19 +136,16 @@ class AssembleeXMLParser(BaseParser):
         The DILA XML format for AN debates uses a specific schema.
         This is a skeleton implementation based on expected structure.
 
+        The file is streamed with ``iterparse``: each ``paragraphe`` is
+        turned into a record as soon as it has been read and then freed, so
+        memory stays constant regardless of the session size.
+
         Args:
             xml_path: Path to XML file
 
         Yields:
             SpeechRecord objects
         """
-        try:
-            tree = etree.parse(str(xml_path))
-            root = tree.getroot()
-        except etree.XMLSyntaxError as e:
-            self.logger.warning(f"XML syntax error in {xml_path}: {e}")
-            return
-
         # DILA XML structure (expected):
         # <debatsAssembleeNationale>
         #   <metadonnees>
@@ -101,76 +158,137 @@ class AssembleeXMLParser(BaseParser):
         #     </paragraphe>
         #   </contenu>
         # </debatsAssembleeNationale>
+        #
+        # The session date sits in <metadonnees>, ahead of the content, so it
+        # is known before the first paragraphe is reached.
+        #
+        # The path is passed rather than a file object (or an mmap of one):
+        # libxml2 then reads the file itself in C, whereas a Python file-like
+        # source is pulled through read() into bytes objects chunk by chunk.
+        context = etree.iterparse(
+            str(xml_path),
+            events=("end",),
+            tag=("paragraphe", *self.SESSION_DATE_TAGS),
+            **self.ITERPARSE_OPTIONS,
+        )
 
-        # Extract session date
-        session_date = self._extract_session_date(root)
-        if session_date:
-            if not (self.date_range.start <= session_date <= self.date_range.end):
-                return
-
-        # Parse interventions (skeleton)
-        for intervention in root.iter("paragraphe"):
-            record = self._parse_intervention(intervention, session_date, xml_path)
-            if record:
-                yield record
-
-    def _extract_session_date(self, root: etree._Element) -> Optional[date]:
-        """Extract session date from XML."""
-        for tag in ["dateSeance", "date", "jour"]:
-            elem = root.find(f".//{tag}")
-            if elem is not None and elem.text:
-                try:
-                    from datetime import datetime
-                    return datetime.strptime(elem.text.strip()[:10], "%Y-%m-%d").date()
-                except ValueError:
-                    continue
-        return None
+        session_date: Optional[date] = None
+        # Per-file values, built once the session date is known
+        sid_prefix = ""
+        file_fields: Optional[dict] = None
+        try:
+            for _, elem in context:
+                if elem.tag == "paragraphe":
+                    if file_fields is not None:
+                        record = self._parse_intervention(elem, sid_prefix, file_fields)
+                        if record:
+                            yield record
+                    # Free the paragraphe and everything already read before it
+                    elem.clear(keep_tail=False)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                elif session_date is None:
+                    session_date = self._parse_session_date(elem)
+                    if session_date and not (
+                        self._range_lo <= session_date.toordinal() <= self._range_hi
+                    ):
+                        return
+                    if session_date:
+                        date_iso = session_date.isoformat()
+                        stem = xml_path.stem
+                        sid_prefix = f"an_{date_iso}_{stem}_L"
+                        file_fields = {
+                            **_CONSTANT_FIELDS,
+                            "source_url": f"{self.DEBATE_URL}/{stem}",
+                            "retrieved_at": self.retrieved_at,
+                            "date": session_date,
+                            "title": f"Intervention - Assemblée nationale - {date_iso}",
+                            "session_id": stem,
+                        }
+        except etree.XMLSyntaxError as e:
+            self.logger.warning(f"XML syntax error in {xml_path}: {e}")
+            return
+
+    def _parse_session_date(self, elem: etree._Element) -> Optional[date]:
+        """Parse the session date from a date element."""
+        if not elem.text:
+            return None
+        return parse_iso_date(elem.text.strip())
 
     def _parse_intervention(
-        self, elem: etree._Element, session_date: Optional[date], xml_path: Path
+        self, elem: etree._Element, sid_prefix: str, file_fields: dict
     ) -> Optional[SpeechRecord]:
-        """Parse an intervention element."""
-        if not session_date:
-            return None
+        """Parse an intervention element.
+
+        Args:
+            elem: paragraphe element
+            sid_prefix: Source ID up to the line number
+            file_fields: Record fields shared by the whole file
 
+        Returns:
+            SpeechRecord or None
+        """
         # Extract speaker
-        orateur = elem.find(".//orateur")
-        if orateur is None:
+        orateur = self._X_ORATEUR(elem)
+        if not orateur:
             return None
+        orateur = orateur[0]
 
-        nom = orateur.find(".//nom")
-        speaker = nom.text.strip() if nom is not None and nom.text else None
+        nom = self._X_NOM(orateur)
+        speaker = nom[0].text.strip() if nom and nom[0].text else None
         if not speaker:
             return None
+        # The same deputies speak many times per session
+        speaker = sys.intern(speaker)
+
+        # Extract text; a missing <texte> gives an empty text, which is only
+        # kept when min_text_length is 0
+        min_length = self.config.processing.min_text_length
+        texte = self._X_TEXTE(elem)
+        if not texte:
+            if min_length > 0:
+                return None
+            parts: list[str] = []
+        else:
+            parts = list(texte[0].itertext())
 
-        # Extract text
-        texte = elem.find(".//texte")
-        text = ""
-        if texte is not None:
-            text = " ".join(texte.itertext()).strip()
+        # The summed length bounds the joined text from above, so short
+        # interventions are rejected before any string is built
+        if min_length and sum(map(len, parts)) + len(parts) - 1 < min_length:
+            return None
 
-        if len(text) < self.config.processing.min_text_length:
+        text = " ".join(parts).strip()
+        if len(text) < min_length:
             return None
 
         # Build source ID
-        line = getattr(elem, "sourceline", 0)
-        source_id = f"an_{session_date.isoformat()}_{xml_path.stem}_L{line}"
+        source_id = sid_prefix + str(getattr(elem, "sourceline", 0))
 
         # Speaker role
-        qualite = orateur.find(".//qualite")
-        speaker_role = qualite.text.strip() if qualite is not None and qualite.text else None
+        qualite = self._X_QUALITE(orateur)
+        speaker_role = qualite[0].text.strip() if qualite and qualite[0].text else None
 
-        return SpeechRecord(
-            source="assemblee",
+        return SpeechRecord.from_validated(
+            **file_fields,
             source_id=source_id,
-            source_url=f"https://www.assemblee-nationale.fr/dyn/debats/{xml_path.stem}",
-            date=session_date,
             speaker=speaker,
-            title=f"Intervention - Assemblée nationale - {session_date}",
             text=text,
-            lang="fr",
-            license="Licence Ouverte",
             speaker_role=speaker_role,
-            speech_type="intervention",
-            session_id=xml_path.stem,
         )
+
+
+def _parse_file_worker(
+    config: Config, retrieved_at: datetime, xml_path: Path
+) -> list[dict]:
+    """Parse one Assemblee XML file in a worker process.
+
+    Args:
+        config: Pipeline configuration
+        retrieved_at: Collection time of the run
+        xml_path: Path to XML file
+
+    Returns:
+        Field dictionaries of the parsed records
+    """
+    parser = AssembleeXMLParser(config, retrieved_at)
+    return [dict(record.__dict__) for record in parser._parse_file_safe(xml_path)]
@@ -1,13 +1,21 @@
 """Base parser interface."""
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, Optional, TypeVar
 
 from ..config import Config
 from ..models import SpeechRecord
+from ..utils.fs import tree_stamp
+from ..utils.hashing import compute_hash
 from ..utils.logging import get_logger
 
+T = TypeVar("T")
+
 
 class BaseParser(ABC):
     """Abstract base class for data parsers.
@@ -16,14 +24,19 @@ class BaseParser(ABC):
     objects from raw collected data.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, retrieved_at: Optional[datetime] = None):
         """Initialize the parser.
 
         Args:
             config: Pipeline configuration
+            retrieved_at: Collection time stamped on every record; defaults
+                to the time the parser is created
         """
         self.config = config
         self.logger = get_logger()
+        self.retrieved_at = retrieved_at or datetime.utcnow()
+        # Worker pool shared with the rest of the pipeline, if any
+        self.executor: Optional[Executor] = None
 
     @abstractmethod
     def parse(self, source_path: Path) -> Iterator[SpeechRecord]:
@@ -37,6 +50,48 @@ class BaseParser(ABC):
         """
         pass
 
+    def _map_files(
+        self,
+        worker: Callable[[Config, datetime, Path], T],
+        files: list[Path],
+        workers: int,
+    ) -> Iterator[T]:
+        """Apply a per-file worker function in worker processes.
+
+        The files are sent in chunks to ``executor`` when the pipeline has
+        set one, or else to a pool of ``workers`` processes of its own. Only
+        a few chunks per worker are in flight, so parsing runs a bounded
+        distance ahead of the consumer.
+
+        Args:
+            worker: Module-level function taking the config, the collection
+                time and a file path
+            files: Files to process
+            workers: Number of worker processes
+
+        Yields:
+            The worker's result for each file, in file order
+        """
+        chunksize = max(1, len(files) // (workers * 4))
+        chunks = (files[i : i + chunksize] for i in range(0, len(files), chunksize))
+
+        with ExitStack() as stack:
+            pool = self.executor
+            if pool is None:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+
+            pending: deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(
+                    pool.submit(
+                        _map_chunk, worker, self.config, self.retrieved_at, chunk
+                    )
+                )
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
     @abstractmethod
     def get_source_name(self) -> str:
         """Return the name of this source.
@@ -49,7 +104,10 @@ class BaseParser(ABC):
     def count_records(self, source_path: Path) -> int:
         """Count total records without fully parsing.
 
-        Override in subclasses for efficient counting.
+        Override in subclasses for efficient counting. The default parses
+        once and stores the count in ``<output_dir>/counts/<source>.count``,
+        keyed on the source path, the number and newest modification time
+        of its files, and the settings that affect which records are kept.
 
         Args:
             source_path: Path to the collected data
@@ -57,4 +115,50 @@ class BaseParser(ABC):
         Returns:
             Estimated record count
         """
-        return sum(1 for _ in self.parse(source_path))
+        try:
+            file_count, newest_mtime = tree_stamp(source_path)
+        except FileNotFoundError:
+            return 0
+
+        key = compute_hash(
+            repr(
+                (
+                    self.get_source_name(),
+                    str(Path(source_path).resolve()),
+                    file_count,
+                    newest_mtime,
+                    self.config.pipeline.date_range.start,
+                    self.config.pipeline.date_range.end,
+                    self.config.processing.min_text_length,
+                )
+            ),
+            "xxhash64",
+        )
+
+        # Kept with the outputs, so the raw data directory is never written
+        count_path = (
+            Path(self.config.pipeline.output_dir)
+            / "counts"
+            / f"{self.get_source_name()}.count"
+        )
+        try:
+            cached_key, cached_count = count_path.read_text().split()
+            if cached_key == key:
+                return int(cached_count)
+        except (FileNotFoundError, ValueError):
+            pass
+
+        count = sum(1 for _ in self.parse(source_path))
+        count_path.parent.mkdir(parents=True, exist_ok=True)
+        count_path.write_text(f"{key} {count}")
+        return count
+
+
+def _map_chunk(
+    worker: Callable[[Config, datetime, Path], T],
+    config: Config,
+    retrieved_at: datetime,
+    paths: list[Path],
+) -> list[T]:
+    """Apply a per-file worker function to a chunk of files."""
+    return [worker(config, retrieved_at, path) for path in paths]
@@ -3,11 +3,14 @@
 This is a skeleton implementation for the optional Europarl module.
 """
 
+import os
+from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Optional
 
 from ..config import Config
 from ..models import SpeechRecord
+from ..utils.fs import iter_files
 from ..utils.logging import get_logger
 from .base import BaseParser
 
@@ -22,8 +25,23 @@ class EuroparlParser(BaseParser):
     - XML verbatim reports
     """
 
-    def __init__(self, config: Config):
-        super().__init__(config)
+    NOTICE_FILENAME = "EUROPARL_STUB.md"
+
+    # File extension -> format handled by the matching _parse_* method
+    FILE_KINDS = {
+        ".ttl": "rdf",
+        ".rdf": "rdf",
+        ".json": "json",
+        ".jsonld": "json",
+        ".xml": "xml",
+    }
+
+    # Formats whose _parse_* method is implemented; files of other formats
+    # are skipped without calling the stub once per file
+    IMPLEMENTED_KINDS: frozenset[str] = frozenset()
+
+    def __init__(self, config: Config, retrieved_at: Optional[datetime] = None):
+        super().__init__(config, retrieved_at)
         self.date_range = config.pipeline.date_range
         self.filter_country = config.sources.europarl.filter_country
 
@@ -39,40 +57,44 @@ class EuroparlParser(BaseParser):
         Yields:
             SpeechRecord objects
         """
-        if not source_path.exists():
+        try:
+            os.stat(source_path)
+        except FileNotFoundError:
             self.logger.info(f"Europarl source path does not exist: {source_path}")
             return
 
-        # Check for stub notice
-        notice_path = source_path / "EUROPARL_STUB.md"
-        if notice_path.exists():
-            self.logger.info(
-                "Europarl stub notice found. Data collection not implemented."
-            )
-            return
-
-        # Look for data files
-        rdf_files = list(source_path.rglob("*.ttl")) + list(source_path.rglob("*.rdf"))
-        json_files = list(source_path.rglob("*.json")) + list(source_path.rglob("*.jsonld"))
-        xml_files = list(source_path.rglob("*.xml"))
-
-        all_files = rdf_files + json_files + xml_files
-
-        if not all_files:
+        # Look for data files, classifying them by extension in a single walk
+        # that also checks for the stub notice
+        notice_path = os.path.join(source_path, self.NOTICE_FILENAME)
+        files: dict[str, list[str]] = {"rdf": [], "json": [], "xml": []}
+        for path in iter_files(source_path, (*self.FILE_KINDS, self.NOTICE_FILENAME)):
+            if path == notice_path:
+                self.logger.info(
+                    "Europarl stub notice found. Data collection not implemented."
+                )
+                return
+            kind = self.FILE_KINDS.get(os.path.splitext(path)[1])
+            if kind:
+                files[kind].append(path)
+
+        total = sum(len(paths) for paths in files.values())
+        if not total:
             self.logger.info("No Europarl data files found")
             return
 
-        self.logger.info(f"Found {len(all_files)} Europarl data files")
-
-        # Parse based on file type
-        for file_path in rdf_files:
-            yield from self._parse_rdf(file_path)
-
-        for file_path in json_files:
-            yield from self._parse_json(file_path)
-
-        for file_path in xml_files:
-            yield from self._parse_xml(file_path)
+        self.logger.info(f"Found {total} Europarl data files")
+
+        # Parse based on file type, skipping formats that have no parser yet
+        for kind, paths in files.items():
+            if kind not in self.IMPLEMENTED_KINDS:
+                if paths:
+                    self.logger.debug(
+                        f"{kind} parsing not implemented, skipping {len(paths)} files"
+                    )
+                continue
+            parse_file = getattr(self, f"_parse_{kind}")
+            for file_path in paths:
+                yield from parse_file(Path(file_path))
 
     def _parse_rdf(self, file_path: Path) -> Iterator[SpeechRecord]:
         """Parse RDF/Turtle file.
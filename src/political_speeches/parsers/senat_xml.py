@@ -2,6 +2,7 @@
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator, Optional
 
@@ -20,6 +21,62 @@ NAMESPACES = {
     "xhtml": XHTML_NS,
 }
 
+# Tag filters matched by lxml against each element's local name, in any
+# namespace or none (CRI intervenants, XHTML or bare paragraphs), so no
+# per-element namespace handling happens in Python
+_INTERVENANT_TAG = "{*}intervenant"
+_P_TAG = "{*}p"
+
+# Date in a CRI filename, e.g. d20050127.xml
+_FILENAME_DATE_RE = re.compile(r"^[dD](\d{4})(\d{2})(\d{2})")
+# Any date-like digit run, with optional separators
+_LOOSE_DATE_RE = re.compile(r"(\d{4})[-_]?(\d{2})[-_]?(\d{2})")
+# Numeric date forms: ISO (YYYY-MM-DD), French (DD/MM/YYYY or DD-MM-YYYY)
+# and compact (YYYYMMDD)
+_DATE_MULTI_RE = re.compile(
+    r"^(?:(?P<y1>\d{4})-(?P<m1>\d{1,2})-(?P<d1>\d{1,2})"
+    r"|(?P<d2>\d{1,2})[/-](?P<m2>\d{1,2})[/-](?P<y2>\d{4})"
+    r"|(?P<y3>\d{4})(?P<m3>\d{2})(?P<d3>\d{2}))"
+)
+
+
+@lru_cache(maxsize=4096)
+def _titlecase_name(name: str) -> str:
+    """Title-case an all-caps speaker name.
+
+    Cached, as the same few hundred speakers recur across every session.
+
+    Args:
+        name: Upper-case name, e.g. "JEAN-PAUL EMORINE"
+
+    Returns:
+        Title-cased name, e.g. "Jean-Paul Emorine"
+    """
+    return " ".join(
+        "-".join(piece.title() for piece in part.split("-"))
+        for part in name.split()
+    )
+
+
+@lru_cache(maxsize=8192)
+def _stem_to_date(stem: str) -> Optional[date]:
+    """Parse the session date of a CRI filename stem.
+
+    Args:
+        stem: Filename without extension, e.g. "d20050127"
+
+    Returns:
+        Date or None
+    """
+    # Match format like d20050127 or D20050127
+    match = _FILENAME_DATE_RE.match(stem)
+    if match:
+        try:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass
+    return None
+
 
 class SenatXMLParser(BaseParser):
     """Parser for Senat comptes rendus XML files.
@@ -33,8 +90,42 @@ class SenatXMLParser(BaseParser):
     - <p> elements for text content
     """
 
-    def __init__(self, config: Config):
-        super().__init__(config)
+    # Compiled lookups, one per candidate tag in order of preference; each
+    # returns the first matching descendant, if any
+    _SPEAKER_XPS = tuple(
+        etree.XPath(f"(.//{tag})[1]")
+        for tag in ("orateur", "intervenant", "auteur", "nom")
+    )
+    # Dates and roles sit near the top of their element, so the two levels
+    # below it are searched for every tag before any full-subtree walk
+    _DATE_XPS = tuple(
+        etree.XPath(pattern.format(tag=tag))
+        for pattern in ("(./{tag}|./*/{tag})[1]", "(.//{tag})[1]")
+        for tag in ("date", "dateSeance", "date_seance", "jour")
+    )
+    # Role lookups match all three role tags in one traversal and return
+    # the text of the first one that has any
+    _ROLE_XPS = tuple(
+        etree.XPath(f"({union})[text()][1]/text()[1]")
+        for union in (
+            "./qualite|./fonction|./titre|./*/qualite|./*/fonction|./*/titre",
+            ".//qualite|.//fonction|.//titre",
+        )
+    )
+    # Bare or CRI-namespaced, resolved through the NAMESPACES prefixes
+    _NOM_XP = etree.XPath("(.//cri:nom|.//nom)[1]", namespaces=NAMESPACES)
+    _INTERVENTION_DATE_XP = etree.XPath(
+        "(.//cri:date|.//date)[1]", namespaces=NAMESPACES
+    )
+
+    # Lenient parsing to handle malformed XML, for both parse and iterparse
+    PARSER_OPTIONS = {"recover": True, "encoding": "utf-8"}
+
+    # Below this many files, process startup costs more than it saves
+    PARALLEL_MIN_FILES = 8
+
+    def __init__(self, config: Config, retrieved_at: Optional[datetime] = None):
+        super().__init__(config, retrieved_at)
         self.date_range = config.pipeline.date_range
 
     def get_source_name(self) -> str:
@@ -62,41 +153,58 @@ class SenatXMLParser(BaseParser):
         self.logger.info(f"Parsing {len(xml_files)} Senat XML files")
 
         parsed_count = 0
-        for xml_file in xml_files:
-            try:
-                for record in self._parse_xml_file(xml_file):
+        workers = min(self.config.pipeline.max_workers, len(xml_files))
+        if workers < 2 or len(xml_files) < self.PARALLEL_MIN_FILES:
+            for xml_file in xml_files:
+                for record in self._parse_file_safe(xml_file):
                     parsed_count += 1
                     yield record
-            except Exception as e:
-                self.logger.warning(f"Failed to parse {xml_file}: {e}")
+        else:
+            # Files are parsed in worker processes, in file order, so the
+            # output (and therefore deduplication) stays deterministic
+            for rows in self._map_files(_parse_file_worker, xml_files, workers):
+                for row in rows:
+                    row["retrieved_at"] = self.retrieved_at
+                    parsed_count += 1
+                    yield SpeechRecord.from_validated(**row)
 
         self.logger.info(f"Parsed {parsed_count} interventions from Senat XML files")
 
+    def _parse_file_safe(self, xml_path: Path) -> Iterator[SpeechRecord]:
+        """Parse one file, logging instead of raising on failure."""
+        try:
+            yield from self._parse_xml_file(xml_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse {xml_path}: {e}")
+
     def _parse_xml_file(self, xml_path: Path) -> Iterator[SpeechRecord]:
         """Parse a single XML file.
 
+        When the session date is in the filename, out-of-range files are
+        skipped without being opened and the others are streamed with
+        ``iterparse``, so only one intervention is held in memory at a
+        time. Otherwise the date has to be looked up in the document, and
+        the whole tree is built once and reused.
+
         Args:
             xml_path: Path to XML file
 
         Yields:
             SpeechRecord objects
         """
-        # Use lenient parser to handle malformed XML
-        parser = etree.XMLParser(recover=True, encoding="utf-8")
-
-        try:
-            tree = etree.parse(str(xml_path), parser)
-            root = tree.getroot()
-        except etree.XMLSyntaxError as e:
-            self.logger.warning(f"XML syntax error in {xml_path}: {e}")
-            return
-        except Exception as e:
-            self.logger.warning(f"Failed to parse {xml_path}: {e}")
-            return
-
         # Extract session date from filename (format: d20050127.xml)
         session_date = self._extract_date_from_filename(xml_path)
+        root = None
         if not session_date:
+            try:
+                parser = etree.XMLParser(**self.PARSER_OPTIONS)
+                root = etree.parse(str(xml_path), parser).getroot()
+            except etree.XMLSyntaxError as e:
+                self.logger.warning(f"XML syntax error in {xml_path}: {e}")
+                return
+            except Exception as e:
+                self.logger.warning(f"Failed to parse {xml_path}: {e}")
+                return
             session_date = self._extract_session_date(xml_path, root)
 
         if session_date:
@@ -107,58 +215,57 @@ class SenatXMLParser(BaseParser):
             self.logger.debug(f"Could not determine date for {xml_path}")
             return
 
-        # Primary structure: <cri:intervenant> elements (Senat CRI format)
-        # Try with namespace first
+        # Same for every intervention of the session
+        source_url = self._build_source_url(xml_path)
+
+        # Primary structure: <cri:intervenant> elements (Senat CRI format),
+        # in the CRI namespace or any other
         found_intervenants = False
-        for intervenant in root.iter(f"{{{CRI_NS}}}intervenant"):
+        for intervenant in self._iter_elements(xml_path, _INTERVENANT_TAG, root):
             found_intervenants = True
-            record = self._parse_cri_intervenant(intervenant, session_date, xml_path)
+            record = self._parse_cri_intervenant(
+                intervenant, session_date, xml_path, source_url
+            )
             if record:
                 yield record
 
-        # If no namespaced elements found, try local name matching
-        if not found_intervenants:
-            for elem in root.iter():
-                local_name = self._get_local_name(elem)
-                if local_name == "intervenant":
-                    found_intervenants = True
-                    record = self._parse_cri_intervenant(elem, session_date, xml_path)
-                    if record:
-                        yield record
-
         # Fallback: Try legacy structures
         if not found_intervenants:
-            for intervention in root.iter("intervention"):
-                record = self._parse_intervention(intervention, session_date, xml_path)
+            for intervention in self._iter_elements(xml_path, "intervention", root):
+                record = self._parse_intervention(
+                    intervention, session_date, xml_path, source_url
+                )
                 if record:
                     yield record
 
-    def _get_local_name(self, elem: etree._Element) -> Optional[str]:
-        """Get the local name of an element, handling both namespaced and prefixed tags.
+    def _iter_elements(
+        self, xml_path: Path, tag: str, root: Optional[etree._Element] = None
+    ) -> Iterator[etree._Element]:
+        """Iterate over the elements of a file with a given tag.
+
+        With a parsed ``root`` the tree is simply searched. Otherwise the
+        file is streamed and each element is freed, together with the
+        siblings read before it, once the caller has processed it.
 
         Args:
-            elem: XML element
+            xml_path: Path to XML file
+            tag: Tag to match (``{*}`` wildcards allowed)
+            root: Already parsed root element, if any
 
-        Returns:
-            Local name or None
+        Yields:
+            Matching elements in document order
         """
-        tag = elem.tag
-        if not isinstance(tag, str):
-            return None
-
-        # Handle namespaced tag: {http://...}localname
-        if tag.startswith("{"):
-            try:
-                return etree.QName(tag).localname
-            except ValueError:
-                return None
-
-        # Handle prefixed tag: prefix:localname
-        if ":" in tag:
-            return tag.split(":", 1)[1]
+        if root is not None:
+            yield from root.iter(tag)
+            return
 
-        # Plain tag name
-        return tag
+        for _, elem in etree.iterparse(
+            str(xml_path), events=("end",), tag=tag, **self.PARSER_OPTIONS
+        ):
+            yield elem
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
     def _extract_date_from_filename(self, xml_path: Path) -> Optional[date]:
         """Extract date from Senat filename format (d20050127.xml).
@@ -169,18 +276,14 @@ class SenatXMLParser(BaseParser):
         Returns:
             Date or None
         """
-        filename = xml_path.stem
-        # Match format like d20050127 or D20050127
-        match = re.match(r"[dD](\d{4})(\d{2})(\d{2})", filename)
-        if match:
-            try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                pass
-        return None
+        return _stem_to_date(xml_path.stem)
 
     def _parse_cri_intervenant(
-        self, elem: etree._Element, session_date: date, xml_path: Path
+        self,
+        elem: etree._Element,
+        session_date: date,
+        xml_path: Path,
+        source_url: str,
     ) -> Optional[SpeechRecord]:
         """Parse a <cri:intervenant> element.
 
@@ -188,6 +291,7 @@ class SenatXMLParser(BaseParser):
             elem: XML element
             session_date: Session date
             xml_path: Source file path
+            source_url: URL of the session page
 
         Returns:
             SpeechRecord or None
@@ -200,6 +304,24 @@ class SenatXMLParser(BaseParser):
         # Extract speaker role from 'qua' attribute (qualite)
         speaker_role = elem.get("qua", "").strip() or None
 
+        # Extract text from <p> elements within the intervenant
+        text_parts: list[str] = []
+        text_length = 0
+        for p_elem in elem.iter(_P_TAG):
+            # Get all text content from this paragraph
+            p_text = self._get_element_text(p_elem)
+            if p_text:
+                # Count the separating space as well
+                text_length += len(p_text) + (1 if text_parts else 0)
+                text_parts.append(p_text)
+
+        # Skip if text is too short; the parts are already stripped, so this
+        # is the length of the joined text, known before it is built
+        if text_length < self.config.processing.min_text_length:
+            return None
+
+        text = " ".join(text_parts)
+
         # Extract ID - prefix with filename to make globally unique
         xml_id = elem.get("id", "")
         if xml_id:
@@ -207,25 +329,6 @@ class SenatXMLParser(BaseParser):
         else:
             source_id = self._build_source_id(elem, xml_path, session_date)
 
-        # Build source URL
-        source_url = self._build_source_url(xml_path)
-
-        # Extract text from <p> elements within the intervenant
-        text_parts = []
-        for p_elem in elem.iter():
-            local_name = self._get_local_name(p_elem)
-            if local_name == "p":
-                # Get all text content from this paragraph
-                p_text = self._get_element_text(p_elem)
-                if p_text:
-                    text_parts.append(p_text)
-
-        text = " ".join(text_parts).strip()
-
-        # Skip if text is too short
-        if len(text) < self.config.processing.min_text_length:
-            return None
-
         # Clean up speaker name (remove trailing periods, normalize case)
         speaker = self._clean_speaker_name(speaker)
 
@@ -244,6 +347,7 @@ class SenatXMLParser(BaseParser):
             title=title,
             text=text,
             lang="fr",
+            retrieved_at=self.retrieved_at,
             license="Licence Ouverte",
             speaker_role=speaker_role,
             speech_type="intervention",
@@ -258,16 +362,8 @@ class SenatXMLParser(BaseParser):
         Returns:
             Combined text content
         """
-        texts = []
-        if elem.text:
-            texts.append(elem.text.strip())
-        for child in elem:
-            child_text = self._get_element_text(child)
-            if child_text:
-                texts.append(child_text)
-            if child.tail:
-                texts.append(child.tail.strip())
-        return " ".join(filter(None, texts))
+        # itertext walks the subtree in C, in document order
+        return " ".join(filter(None, map(str.strip, elem.itertext())))
 
     def _clean_speaker_name(self, name: str) -> str:
         """Clean up speaker name.
@@ -283,9 +379,7 @@ class SenatXMLParser(BaseParser):
         # Normalize case (Title Case for names)
         # But preserve all-caps for some French names
         if name.isupper():
-            # Convert "JEAN-PAUL EMORINE" to "Jean-Paul Emorine"
-            parts = name.split()
-            name = " ".join(part.title() if "-" not in part else "-".join(p.title() for p in part.split("-")) for part in parts)
+            name = _titlecase_name(name)
         return name
 
     def _extract_session_date(
@@ -301,10 +395,10 @@ class SenatXMLParser(BaseParser):
             Date or None
         """
         # Try XML elements
-        for tag in ["date", "dateSeance", "date_seance", "jour"]:
-            elem = root.find(f".//{tag}")
-            if elem is not None and elem.text:
-                parsed = self._parse_date_string(elem.text)
+        for xpath in self._DATE_XPS:
+            found = xpath(root)
+            if found and found[0].text:
+                parsed = self._parse_date_string(found[0].text)
                 if parsed:
                     return parsed
 
@@ -317,7 +411,7 @@ class SenatXMLParser(BaseParser):
 
         # Try filename pattern (e.g., seance_20050315.xml)
         filename = xml_path.stem
-        date_match = re.search(r"(\d{4})[-_]?(\d{2})[-_]?(\d{2})", filename)
+        date_match = _LOOSE_DATE_RE.search(filename)
         if date_match:
             try:
                 return date(
@@ -335,26 +429,32 @@ class SenatXMLParser(BaseParser):
         if not date_str:
             return None
 
-        date_str = date_str.strip()
+        date_str = date_str.strip()[:10]
 
-        formats = [
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%d-%m-%Y",
-            "%Y%m%d",
-            "%d %B %Y",  # French format
-        ]
-
-        for fmt in formats:
+        match = _DATE_MULTI_RE.match(date_str)
+        if match:
+            y, m, d = (
+                match["y1"] or match["y2"] or match["y3"],
+                match["m1"] or match["m2"] or match["m3"],
+                match["d1"] or match["d2"] or match["d3"],
+            )
             try:
-                return datetime.strptime(date_str[:10], fmt).date()
+                return date(int(y), int(m), int(d))
             except ValueError:
-                continue
+                return None
 
-        return None
+        # Textual month, e.g. "27 janvier 2005" under a French locale
+        try:
+            return datetime.strptime(date_str, "%d %B %Y").date()
+        except ValueError:
+            return None
 
     def _parse_intervention(
-        self, elem: etree._Element, session_date: Optional[date], xml_path: Path
+        self,
+        elem: etree._Element,
+        session_date: Optional[date],
+        xml_path: Path,
+        source_url: str,
     ) -> Optional[SpeechRecord]:
         """Parse an <intervention> element.
 
@@ -362,6 +462,7 @@ class SenatXMLParser(BaseParser):
             elem: XML element
             session_date: Session date
             xml_path: Source file path
+            source_url: URL of the session page
 
         Returns:
             SpeechRecord or None
@@ -381,9 +482,9 @@ class SenatXMLParser(BaseParser):
 
         # Get date (from intervention or session)
         intervention_date = session_date
-        date_elem = elem.find(".//date")
-        if date_elem is not None and date_elem.text:
-            parsed = self._parse_date_string(date_elem.text)
+        date_elem = self._INTERVENTION_DATE_XP(elem)
+        if date_elem and date_elem[0].text:
+            parsed = self._parse_date_string(date_elem[0].text)
             if parsed:
                 intervention_date = parsed
 
@@ -392,10 +493,10 @@ class SenatXMLParser(BaseParser):
 
         # Speaker role
         speaker_role = None
-        for tag in ["qualite", "fonction", "titre"]:
-            role_elem = elem.find(f".//{tag}")
-            if role_elem is not None and role_elem.text:
-                speaker_role = role_elem.text.strip()
+        for xpath in self._ROLE_XPS:
+            role_text = xpath(elem)
+            if role_text:
+                speaker_role = role_text[0].strip()
                 break
 
         # Build title with speaker info
@@ -407,12 +508,13 @@ class SenatXMLParser(BaseParser):
         return SpeechRecord(
             source="senat",
             source_id=source_id,
-            source_url=self._build_source_url(xml_path),
+            source_url=source_url,
             date=intervention_date,
             speaker=speaker,
             title=title,
             text=text,
             lang="fr",
+            retrieved_at=self.retrieved_at,
             license="Licence Ouverte",
             speaker_role=speaker_role,
             speech_type="intervention",
@@ -445,6 +547,7 @@ class SenatXMLParser(BaseParser):
             title=f"{speaker} - Sénat - {session_date}",
             text=text,
             lang="fr",
+            retrieved_at=self.retrieved_at,
             license="Licence Ouverte",
             speech_type="intervention",
         )
@@ -453,11 +556,11 @@ class SenatXMLParser(BaseParser):
         self, elem: etree._Element, session_date: Optional[date], xml_path: Path
     ) -> Optional[SpeechRecord]:
         """Parse an <orateur> block with following text."""
-        speaker_elem = elem.find(".//nom")
-        if speaker_elem is None or not speaker_elem.text:
+        speaker_elem = self._NOM_XP(elem)
+        if not speaker_elem or not speaker_elem[0].text:
             return None
 
-        speaker = speaker_elem.text.strip()
+        speaker = speaker_elem[0].text.strip()
 
         # Get following text content
         text_parts = []
@@ -485,19 +588,21 @@ class SenatXMLParser(BaseParser):
             title=f"{speaker} - Sénat - {session_date}",
             text=text,
             lang="fr",
+            retrieved_at=self.retrieved_at,
             license="Licence Ouverte",
             speech_type="intervention",
         )
 
     def _extract_speaker(self, elem: etree._Element) -> Optional[str]:
         """Extract speaker name from element."""
-        for tag in ["orateur", "intervenant", "auteur", "nom"]:
-            speaker_elem = elem.find(f".//{tag}")
-            if speaker_elem is not None:
+        for xpath in self._SPEAKER_XPS:
+            found = xpath(elem)
+            if found:
+                speaker_elem = found[0]
                 # Check for nested nom element
-                nom = speaker_elem.find(".//nom")
-                if nom is not None and nom.text:
-                    return nom.text.strip()
+                nom = self._NOM_XP(speaker_elem)
+                if nom and nom[0].text:
+                    return nom[0].text.strip()
                 if speaker_elem.text:
                     return speaker_elem.text.strip()
 
@@ -509,16 +614,7 @@ class SenatXMLParser(BaseParser):
 
     def _extract_text(self, elem: etree._Element) -> str:
         """Extract text content from element."""
-        # Get all text content, joining paragraphs
-        texts = []
-
-        for text_elem in elem.iter():
-            if text_elem.text:
-                texts.append(text_elem.text.strip())
-            if text_elem.tail:
-                texts.append(text_elem.tail.strip())
-
-        return " ".join(filter(None, texts))
+        return self._get_element_text(elem)
 
     def _build_source_id(
         self, elem: etree._Element, xml_path: Path, session_date: Optional[date]
@@ -556,3 +652,20 @@ class SenatXMLParser(BaseParser):
         year_month = date_str[:6]  # "201610"
         base_url = self.config.sources.senat.base_url
         return f"{base_url}/s{year_month}/s{date_str}/st{date_str}000.html"
+
+
+def _parse_file_worker(
+    config: Config, retrieved_at: datetime, xml_path: Path
+) -> list[dict]:
+    """Parse one Senat XML file in a worker process.
+
+    Args:
+        config: Pipeline configuration
+        retrieved_at: Collection time of the run
+        xml_path: Path to XML file
+
+    Returns:
+        Field dictionaries of the parsed records
+    """
+    parser = SenatXMLParser(config, retrieved_at)
+    return [dict(record.__dict__) for record in parser._parse_file_safe(xml_path)]
@@ -1,17 +1,17 @@
 """Parser for Vie-publique speeches."""
 
-import json
-import re
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterator, Optional
 
-from lxml import html
+import orjson
 from selectolax.parser import HTMLParser
 
 from ..config import Config
 from ..models import SpeechRecord
+from ..utils.dates import parse_iso_date, speech_date_value
 from ..utils.logging import get_logger
+from ..utils.manifest import iter_manifest
 from .base import BaseParser
 
 
@@ -23,9 +23,22 @@ class ViePubliqueParser(BaseParser):
     2. HTML pages for full text extraction
     """
 
-    def __init__(self, config: Config):
-        super().__init__(config)
+    # Byte strings present in any page the extraction strategies can use:
+    # the JSON-LD script type and the selector class or tag names
+    CONTENT_MARKERS = (
+        b"application/ld+json",
+        b"field--name-field-texte-integral",
+        b"layout-content",
+        b"<main",
+    )
+
+    def __init__(self, config: Config, retrieved_at: Optional[datetime] = None):
+        super().__init__(config, retrieved_at)
         self.date_range = config.pipeline.date_range
+        # ISO dates order the same as strings, so most out-of-range entries
+        # are rejected by a string comparison before any date is built
+        self._start_iso = self.date_range.start.isoformat()
+        self._end_iso = self.date_range.end.isoformat()
 
     def get_source_name(self) -> str:
         return "vie_publique"
@@ -51,65 +64,51 @@ class ViePubliqueParser(BaseParser):
             self.logger.error(f"Manifest not found: {manifest_path}")
             return
 
-        # Load manifest
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Stream the manifest one entry at a time instead of loading it whole
+        total = 0
+        has_pages = pages_dir.exists()
+        with open(manifest_path, "rb") as f:
+            for speech in iter_manifest(f):
+                total += 1
 
-        # Handle both array and object formats
-        if isinstance(data, dict):
-            speeches = data.get("discours", data.get("data", []))
-        else:
-            speeches = data
-
-        self.logger.info(f"Parsing {len(speeches)} speeches from manifest")
-
-        for speech in speeches:
-            # Filter by date range
-            speech_date = self._parse_date(speech)
-            if not speech_date:
-                continue
-            if not (self.date_range.start <= speech_date <= self.date_range.end):
-                continue
-
-            # Extract basic metadata from manifest
-            record = self._parse_manifest_entry(speech, speech_date)
-            if not record:
-                continue
-
-            # Try to get full text from cached HTML page
-            if pages_dir.exists():
-                page_path = pages_dir / f"{record.source_id}.html"
-                if page_path.exists():
-                    full_text = self._extract_text_from_html(page_path)
-                    if full_text:
-                        record = record.model_copy(update={"text": full_text})
-
-            yield record
-
-    def _parse_date(self, speech: dict) -> Optional[date]:
-        """Parse date from speech entry."""
-        # Try various date field names used in the manifest
-        date_str = (
-            speech.get("prononciation")  # Delivery date (primary field in current manifest)
-            or speech.get("date")
-            or speech.get("dateDiscours")
-            or speech.get("date_discours")
-            or speech.get("mise_en_ligne")  # Publication date as fallback
-        )
-        if not date_str:
-            return None
+                # Filter by date range
+                value = speech_date_value(speech)
+                if not value:
+                    continue
+                if (
+                    value[4:5] == "-"
+                    and value[7:8] == "-"
+                    and not (self._start_iso <= value[:10] <= self._end_iso)
+                ):
+                    continue
+                speech_date = parse_iso_date(value)
+                if not speech_date:
+                    continue
+                if not (self.date_range.start <= speech_date <= self.date_range.end):
+                    continue
 
-        try:
-            if "T" in str(date_str):
-                return datetime.fromisoformat(str(date_str).replace("Z", "+00:00")).date()
-            return datetime.strptime(str(date_str)[:10], "%Y-%m-%d").date()
-        except (ValueError, TypeError):
-            return None
+                # Extract basic metadata from manifest
+                fields = self._parse_manifest_entry(speech, speech_date)
+                if not fields:
+                    continue
+
+                # Try to get full text from cached HTML page
+                if has_pages:
+                    page_path = pages_dir / f"{fields['source_id']}.html"
+                    if page_path.exists():
+                        full_text = self._extract_text_from_html(page_path)
+                        if full_text:
+                            fields["text"] = full_text
+
+                # Built once, with the final text
+                yield SpeechRecord(**fields)
+
+        self.logger.info(f"Parsed {total} speeches from manifest")
 
     def _parse_manifest_entry(
         self, speech: dict, speech_date: date
-    ) -> Optional[SpeechRecord]:
-        """Parse a single manifest entry into a SpeechRecord."""
+    ) -> Optional[dict]:
+        """Parse a single manifest entry into SpeechRecord fields."""
         # Extract ID
         source_id = None
         for field in ["id", "identifiant", "uid", "reference"]:
@@ -187,7 +186,7 @@ class ViePubliqueParser(BaseParser):
                 or speech.get("role")
             )
 
-        return SpeechRecord(
+        return dict(
             source="vie_publique",
             source_id=source_id,
             source_url=url,
@@ -196,6 +195,7 @@ class ViePubliqueParser(BaseParser):
             title=title,
             text=text,
             lang="fr",
+            retrieved_at=self.retrieved_at,
             license="Licence Ouverte v2.0",
             speaker_role=speaker_role,
             speech_type=speech_type,
@@ -216,33 +216,47 @@ class ViePubliqueParser(BaseParser):
             Extracted text or None
         """
         try:
-            html_content = page_path.read_text(encoding="utf-8")
+            raw = page_path.read_bytes()
         except Exception as e:
             self.logger.warning(f"Failed to read {page_path}: {e}")
             return None
 
+        # A page with none of the markers the strategies look for cannot
+        # yield any text, so it is rejected without being parsed
+        if not any(marker in raw for marker in self.CONTENT_MARKERS):
+            return None
+
+        try:
+            html_content = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            self.logger.warning(f"Failed to read {page_path}: {e}")
+            return None
+
+        # Parse once; both strategies query the same tree
+        parser = HTMLParser(html_content)
+
         # Try Schema.org JSON-LD first
-        text = self._extract_from_json_ld(html_content)
+        text = self._extract_from_json_ld(parser)
         if text and len(text) > 100:
             return text
 
         # Try CSS selectors
-        text = self._extract_from_selectors(html_content)
+        text = self._extract_from_selectors(parser)
         if text and len(text) > 100:
             return text
 
         return None
 
-    def _extract_from_json_ld(self, html_content: str) -> Optional[str]:
+    def _extract_from_json_ld(self, parser: HTMLParser) -> Optional[str]:
         """Extract text from Schema.org JSON-LD."""
         try:
             # Find JSON-LD scripts
-            pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-            matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
-
-            for match in matches:
+            for node in parser.css('script[type="application/ld+json"]'):
+                raw = node.text()
+                if not raw:
+                    continue
                 try:
-                    data = json.loads(match)
+                    data = orjson.loads(raw)
 
                     # Handle array of objects
                     if isinstance(data, list):
@@ -254,7 +268,7 @@ class ViePubliqueParser(BaseParser):
                         text = self._extract_text_from_schema(data)
                         if text:
                             return text
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
 
         except Exception:
@@ -278,11 +292,9 @@ class ViePubliqueParser(BaseParser):
 
         return None
 
-    def _extract_from_selectors(self, html_content: str) -> Optional[str]:
+    def _extract_from_selectors(self, parser: HTMLParser) -> Optional[str]:
         """Extract text using CSS selectors."""
         try:
-            parser = HTMLParser(html_content)
-
             # Selectors for vie-publique.fr speech content
             selectors = [
                 ".field--name-field-texte-integral",
@@ -1,26 +1,26 @@
 """Main pipeline orchestrator."""
 
-import asyncio
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeElapsedColumn,
 )
 
-from .collectors import (
-    AssembleeCollector,
-    EuroparlCollector,
-    SenatCollector,
-    ViePubliqueCollector,
-)
-from .config import Config
+from .collectors import BaseCollector, get_collector
+from .config import Config, ProcessingConfig
 from .exporters import JSONLExporter, ParquetExporter
 from .exporters.manifest import ManifestGenerator, SourcesDocGenerator
 from .models import ManifestRecord, SourceStats, SpeechRecord
@@ -32,8 +32,15 @@ from .parsers import (
 )
 from .processors import TextCleaner
 from .processors.deduplicator import CrossSourceDeduplicator
+from .utils.eventloop import run_async
 from .utils.logging import get_console, get_logger, setup_logging
 
+# Records sent to a cleaning worker per task
+CLEAN_BATCH_SIZE = 512
+
+# Below this many records, process startup costs more than it saves
+PARALLEL_MIN_RECORDS = 4 * CLEAN_BATCH_SIZE
+
 
 class Pipeline:
     """Main pipeline orchestrator.
@@ -62,6 +69,9 @@ class Pipeline:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.raw_dir.mkdir(parents=True, exist_ok=True)
 
+        # One timestamp for the whole run, shared by every record
+        self.run_timestamp = datetime.utcnow()
+
         # Initialize components
         self._init_collectors()
         self._init_parsers()
@@ -73,23 +83,36 @@ class Pipeline:
         self.errors: list[str] = []
 
     def _init_collectors(self) -> None:
-        """Initialize data collectors."""
-        self.collectors = {
-            "vie_publique": ViePubliqueCollector(
-                self.config, self.raw_dir / "vie_publique"
-            ),
-            "senat": SenatCollector(self.config, self.raw_dir / "senat"),
-            "assemblee": AssembleeCollector(self.config, self.raw_dir / "assemblee"),
-            "europarl": EuroparlCollector(self.config, self.raw_dir / "europarl"),
-        }
+        """Initialize the collector cache.
+
+        Collectors are created on first use by ``_get_collector`` so only
+        the modules of the sources actually collected are imported.
+        """
+        self.collectors: dict[str, BaseCollector] = {}
+
+    def _get_collector(self, source_name: str) -> BaseCollector:
+        """Return the collector for a source, creating it if needed.
+
+        Args:
+            source_name: Name of the source
+
+        Returns:
+            Collector instance
+        """
+        collector = self.collectors.get(source_name)
+        if collector is None:
+            collector_cls = get_collector(source_name)
+            collector = collector_cls(self.config, self.raw_dir / source_name)
+            self.collectors[source_name] = collector
+        return collector
 
     def _init_parsers(self) -> None:
         """Initialize data parsers."""
         self.parsers = {
-            "vie_publique": ViePubliqueParser(self.config),
-            "senat": SenatXMLParser(self.config),
-            "assemblee": AssembleeXMLParser(self.config),
-            "europarl": EuroparlParser(self.config),
+            "vie_publique": ViePubliqueParser(self.config, self.run_timestamp),
+            "senat": SenatXMLParser(self.config, self.run_timestamp),
+            "assemblee": AssembleeXMLParser(self.config, self.run_timestamp),
+            "europarl": EuroparlParser(self.config, self.run_timestamp),
         }
 
     def run(self, progress: Optional[Progress] = None) -> ManifestRecord:
@@ -107,26 +130,49 @@ class Pipeline:
         with progress:
             # Phase 1: Collect
             self.logger.info("Phase 1: Collecting data from sources")
-            raw_paths = asyncio.run(self._collect_all(progress))
-
-            # Phase 2: Parse
-            self.logger.info("Phase 2: Parsing collected data")
-            all_records = self._parse_all(raw_paths, progress)
+            raw_paths = run_async(self._collect_all(progress))
+
+            # Phases 2-4 are chained generators: each record is parsed,
+            # cleaned and deduplicated before the next one is read, and only
+            # the unique records are kept for export
+            self.logger.info("Phases 2-4: Parsing, cleaning and deduplicating records")
+            with self._create_pool() as pool:
+                for parser in self.parsers.values():
+                    parser.executor = pool
+                try:
+                    parsed_records = self._iter_parsed(raw_paths, progress)
+                    cleaned_records = self._iter_cleaned(
+                        parsed_records, progress, pool
+                    )
+                    unique_records = self._deduplicate(cleaned_records, progress)
+
+                    # Phase 5: Export
+                    self.logger.info("Phase 5: Exporting results")
+                    manifest = self._export(unique_records, progress)
+                finally:
+                    for parser in self.parsers.values():
+                        parser.executor = None
 
-            # Phase 3: Clean
-            self.logger.info("Phase 3: Cleaning text content")
-            cleaned_records = self._clean_all(all_records, progress)
+        self._print_summary(manifest)
+        return manifest
 
-            # Phase 4: Deduplicate
-            self.logger.info("Phase 4: Deduplicating records")
-            unique_records = self._deduplicate(cleaned_records, progress)
+    def _create_pool(self) -> AbstractContextManager[Optional[ProcessPoolExecutor]]:
+        """Create the worker pool shared by parsing and cleaning.
 
-            # Phase 5: Export
-            self.logger.info("Phase 5: Exporting results")
-            manifest = self._export(unique_records, progress)
+        Both stages run at the same time, so they share one pool of
+        ``max_workers`` processes rather than each forking its own.
 
-        self._print_summary(manifest)
-        return manifest
+        Returns:
+            Context manager yielding the pool, or None when running serially
+        """
+        workers = self.config.pipeline.max_workers
+        if workers < 2:
+            return nullcontext()
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_clean_worker,
+            initargs=(self.config.processing,),
+        )
 
     def _create_progress(self) -> Progress:
         """Create a rich Progress instance."""
@@ -154,11 +200,10 @@ class Pipeline:
 
         results = {}
         for source_name in enabled_sources:
-            collector = self.collectors[source_name]
             progress.update(task_id, description=f"Collecting {source_name}")
 
             try:
-                path = await collector.collect()
+                path = await self._get_collector(source_name).collect()
                 results[source_name] = path
 
                 # Initialize stats
@@ -173,112 +218,149 @@ class Pipeline:
 
         return results
 
-    def _parse_all(
+    def _iter_parsed(
         self, raw_paths: dict[str, Path], progress: Progress
-    ) -> List[SpeechRecord]:
-        """Parse all collected data.
+    ) -> Iterator[SpeechRecord]:
+        """Parse all collected data, yielding records as they are parsed.
 
         Args:
             raw_paths: Mapping of source to data path
             progress: Progress tracker
 
-        Returns:
-            List of all parsed records
+        Yields:
+            Parsed records of every source, in source order
         """
-        all_records = []
         task_id = progress.add_task("Parsing...", total=len(raw_paths))
 
         for source_name, path in raw_paths.items():
             parser = self.parsers[source_name]
             progress.update(task_id, description=f"Parsing {source_name}")
 
-            try:
-                records = list(parser.parse(path))
-                all_records.extend(records)
+            stats = self.source_stats.get(source_name)
+            if stats is None:
+                stats = self.source_stats[source_name] = SourceStats()
 
-                if source_name in self.source_stats:
-                    self.source_stats[source_name].parsed = len(records)
-                else:
-                    self.source_stats[source_name] = SourceStats(parsed=len(records))
+            try:
+                for record in parser.parse(path):
+                    stats.parsed += 1
+                    yield record
 
-                self.logger.info(f"Parsed {len(records)} records from {source_name}")
+                self.logger.info(f"Parsed {stats.parsed} records from {source_name}")
 
             except Exception as e:
                 self.logger.error(f"Parsing failed for {source_name}: {e}")
                 self.errors.append(f"Parsing error ({source_name}): {str(e)}")
-                if source_name in self.source_stats:
-                    self.source_stats[source_name].errors += 1
+                stats.errors += 1
 
             progress.update(task_id, advance=1)
 
-        return all_records
-
-    def _clean_all(
-        self, records: List[SpeechRecord], progress: Progress
-    ) -> List[SpeechRecord]:
-        """Clean all records.
+    def _iter_cleaned(
+        self,
+        records: Iterator[SpeechRecord],
+        progress: Progress,
+        pool: Optional[ProcessPoolExecutor] = None,
+    ) -> Iterator[SpeechRecord]:
+        """Clean records, dropping those that fail or are filtered out.
 
         Args:
-            records: List of parsed records
+            records: Iterator of parsed records
             progress: Progress tracker
+            pool: Worker pool to clean in, or None to clean in this process
 
-        Returns:
-            List of cleaned records
+        Yields:
+            Cleaned records
         """
-        task_id = progress.add_task("Cleaning...", total=len(records))
-        cleaned = []
+        # The number of records is not known until parsing has finished
+        task_id = progress.add_task("Cleaning...", total=None)
 
+        min_length = self.config.processing.min_text_length
         exclude_roles = self.config.processing.exclude_speaker_roles
 
-        for record in records:
-            try:
-                cleaned_record = self.cleaner.clean(record)
+        for record, cleaned_record in self._iter_clean_results(records, pool):
+            progress.update(task_id, advance=1)
 
-                # Skip if too short after cleaning
-                if len(cleaned_record.text) < self.config.processing.min_text_length:
-                    continue
+            if isinstance(cleaned_record, str):
+                self.logger.warning(
+                    f"Cleaning failed for {record.source_id}: {cleaned_record}"
+                )
+                continue
 
-                # Skip excluded speaker roles
-                if exclude_roles and cleaned_record.speaker_role in exclude_roles:
-                    continue
+            # Skip if too short after cleaning
+            if len(cleaned_record.text) < min_length:
+                continue
 
-                cleaned.append(cleaned_record)
+            # Skip excluded speaker roles
+            if exclude_roles and cleaned_record.speaker_role in exclude_roles:
+                continue
 
-                # Update stats
-                if record.source in self.source_stats:
-                    self.source_stats[record.source].cleaned += 1
+            # Update stats
+            if record.source in self.source_stats:
+                self.source_stats[record.source].cleaned += 1
 
-            except Exception as e:
-                self.logger.warning(f"Cleaning failed for {record.source_id}: {e}")
+            yield cleaned_record
 
-            progress.update(task_id, advance=1)
+    def _iter_clean_results(
+        self,
+        records: Iterator[SpeechRecord],
+        pool: Optional[ProcessPoolExecutor] = None,
+    ) -> Iterator[tuple[SpeechRecord, Union[SpeechRecord, str]]]:
+        """Clean records, in worker processes when there are enough of them.
 
-        return cleaned
+        Args:
+            records: Iterator of parsed records
+            pool: Worker pool to clean in, or None to clean in this process
+
+        Yields:
+            For each record in order, the record and either its cleaned
+            version or an error message
+        """
+        records = iter(records)
+        head = list(islice(records, PARALLEL_MIN_RECORDS))
+        if pool is None or len(head) < PARALLEL_MIN_RECORDS:
+            for record in chain(head, records):
+                yield record, _clean_record(self.cleaner, record)
+            return
+
+        batches = _iter_batches(chain(head, records), CLEAN_BATCH_SIZE)
+        # At most a few batches per worker are in flight, so parsing only
+        # runs ahead of cleaning by a bounded number of records; futures are
+        # consumed in submission order, so results line up with the input
+        window = 2 * self.config.pipeline.max_workers
+        pending: deque[tuple[list[SpeechRecord], Future]] = deque()
+        for batch in batches:
+            pending.append((batch, pool.submit(_clean_worker, batch)))
+            if len(pending) >= window:
+                batch, future = pending.popleft()
+                yield from zip(batch, future.result())
+        while pending:
+            batch, future = pending.popleft()
+            yield from zip(batch, future.result())
 
     def _deduplicate(
-        self, records: List[SpeechRecord], progress: Progress
+        self, records: Iterator[SpeechRecord], progress: Progress
     ) -> List[SpeechRecord]:
         """Deduplicate records.
 
         Args:
-            records: List of cleaned records
+            records: Iterator of cleaned records
             progress: Progress tracker
 
         Returns:
             List of unique records
         """
-        task_id = progress.add_task("Deduplicating...", total=len(records))
+        task_id = progress.add_task("Deduplicating...", total=None)
         unique = []
 
-        for record in self.deduplicator.deduplicate(iter(records)):
+        # The bar counts records read, so duplicates advance it as well
+        for record in self.deduplicator.deduplicate(
+            _with_progress(records, progress, task_id)
+        ):
             unique.append(record)
 
             # Update stats
             if record.source in self.source_stats:
                 self.source_stats[record.source].deduplicated += 1
 
-            progress.update(task_id, advance=1)
-
         dedupe_stats = self.deduplicator.get_stats()
         self.logger.info(
             f"Deduplication: {dedupe_stats['total_seen']} -> {dedupe_stats['unique']} "
@@ -321,14 +403,21 @@ class Pipeline:
         if self.config.export.parquet:
             progress.update(task_id, description="Exporting Parquet")
             parquet_exporter = ParquetExporter()
-            parquet_exporter.export(records, self.output_dir / "curated.parquet")
+            # Records are transposed into column batches handed straight to
+            # Arrow, one row group at a time, instead of dumping each record
+            # to a dict for a DataFrame holding the whole output
+            parquet_exporter.export_streaming(
+                iter(records),
+                self.output_dir / "curated.parquet",
+                batch_size=parquet_exporter.row_group_size,
+            )
             progress.update(task_id, advance=1)
 
         # Generate manifest
         progress.update(task_id, description="Generating manifest")
         manifest_gen = ManifestGenerator(self.config)
         manifest = manifest_gen.generate_and_write(
-            self.source_stats, self.output_dir, self.errors
+            self.source_stats, self.output_dir, self.errors, self.run_timestamp
         )
         progress.update(task_id, advance=1)
 
@@ -379,8 +468,58 @@ class Pipeline:
         Returns:
             Path to collected data
         """
-        if source_name not in self.collectors:
-            raise ValueError(f"Unknown source: {source_name}")
+        return await self._get_collector(source_name).collect()
+
+
+def _with_progress(
+    records: Iterator[SpeechRecord], progress: Progress, task_id: TaskID
+) -> Iterator[SpeechRecord]:
+    """Pass records through, advancing a progress task for each one."""
+    for record in records:
+        progress.update(task_id, advance=1)
+        yield record
+
+
+def _clean_record(
+    cleaner: TextCleaner, record: SpeechRecord
+) -> Union[SpeechRecord, str]:
+    """Clean one record, returning the error message instead of raising."""
+    try:
+        return cleaner.clean(record)
+    except Exception as e:
+        return str(e)
+
+
+def _iter_batches(
+    records: Iterator[SpeechRecord], size: int
+) -> Iterator[List[SpeechRecord]]:
+    """Split an iterator of records into lists of at most ``size``."""
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+# Cleaner of a worker process, built once by the pool initializer
+_WORKER_CLEANER: Optional[TextCleaner] = None
+
 
-        collector = self.collectors[source_name]
-        return await collector.collect()
+def _init_clean_worker(config: ProcessingConfig) -> None:
+    """Build the cleaner of a worker process.
+
+    Args:
+        config: Processing configuration
+    """
+    global _WORKER_CLEANER
+    _WORKER_CLEANER = TextCleaner(config)
+
+
+def _clean_worker(batch: List[SpeechRecord]) -> List[Union[SpeechRecord, str]]:
+    """Clean a batch of records in a worker process.
+
+    Args:
+        batch: Records to clean
+
+    Returns:
+        Cleaned record or error message for each record, in order
+    """
+    assert _WORKER_CLEANER is not None
+    return [_clean_record(_WORKER_CLEANER, record) for record in batch]
@@ -3,10 +3,20 @@
 import re
 import unicodedata
 from datetime import datetime
-from typing import Iterator
+from typing import Callable, Iterator
 
 from lxml import html
 
+try:
+    import re2
+except ImportError:  # optional speedup, google-re2
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:  # optional speedup for large batches
+    hyperscan = None
+
 from ..config import ProcessingConfig
 from ..models import SpeechRecord
 from ..utils.logging import get_logger
@@ -44,6 +54,19 @@ class TextCleaner:
         r"page \d+",
     ]
 
+    # Courtesy titles at the start of a speaker name, possibly repeated
+    _PREFIX_RE = re.compile(
+        r"^(?:(?:M\.|Mme\.?|Mlle\.?|Dr\.?|Pr\.?|Me\.?)\s+)+", re.IGNORECASE
+    )
+    _PAREN_RE = re.compile(r"\s*\([^)]*\)\s*")
+    _TAG_RE = re.compile(r"<[^>]+>")
+    # Runs of horizontal whitespace, or a lone non-space one, become a space
+    _WS_RE = re.compile(r"[ \t\r\f\v]{2,}|[\t\r\f\v]")
+    _MULTI_NL_RE = re.compile(r"\n{3,}")
+    # Whitespace other than newlines at the end or start of a line
+    _TRAIL_WS_RE = re.compile(r"[^\S\n]+\n")
+    _LEAD_WS_RE = re.compile(r"\n[^\S\n]+")
+
     def __init__(self, config: ProcessingConfig):
         """Initialize the cleaner.
 
@@ -53,11 +76,43 @@ class TextCleaner:
         self.config = config
         self.logger = get_logger()
 
-        # Compile boilerplate patterns
-        self._boilerplate_re = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for pattern in self.BOILERPLATE_PATTERNS
-        ]
+        # Compile boilerplate patterns into one alternation, so the text is
+        # scanned once rather than once per pattern. RE2, when installed,
+        # matches it in linear time without backtracking.
+        boilerplate = "|".join(
+            f"(?:{pattern})" for pattern in self.BOILERPLATE_PATTERNS
+        )
+        if re2 is not None:
+            self._boilerplate_re = re2.compile(f"(?im){boilerplate}")
+        else:
+            self._boilerplate_re = re.compile(
+                boilerplate, re.IGNORECASE | re.MULTILINE
+            )
+
+        # Reused for every record; comments and processing instructions are
+        # dropped while parsing rather than built into the tree
+        self._html_parser = html.HTMLParser(remove_comments=True, remove_pis=True)
+
+        # Cleaning steps enabled by the config, resolved once so clean() runs
+        # them without re-checking the settings for every record:
+        # Unicode normalization, HTML stripping, boilerplate removal and
+        # whitespace normalization
+        steps: list[Callable[[str], str]] = [self._normalize_unicode]
+        if config.strip_html:
+            steps.append(self._strip_html)
+        if config.remove_boilerplate:
+            steps.append(self._remove_boilerplate)
+        steps.append(self._normalize_whitespace)
+        self._text_steps = tuple(steps)
+
+        # Hyperscan, when installed, matches all patterns at once with a
+        # single multi-pattern automaton and takes over boilerplate removal
+        self._hs_db = None
+        if hyperscan is not None:
+            try:
+                self._hs_db = self._compile_hyperscan()
+            except hyperscan.error as e:
+                self.logger.debug(f"Hyperscan unavailable, using regex: {e}")
 
     def clean(self, record: SpeechRecord) -> SpeechRecord:
         """Clean a single speech record.
@@ -69,30 +124,10 @@ class TextCleaner:
             Cleaned speech record
         """
         text = record.text
+        for step in self._text_steps:
+            text = step(text)
 
-        # Step 1: Unicode normalization
-        text = unicodedata.normalize(self.config.unicode_normalize, text)
-
-        # Step 2: Strip HTML if present
-        if self.config.strip_html:
-            text = self._strip_html(text)
-
-        # Step 3: Whitespace normalization
-        text = self._normalize_whitespace(text)
-
-        # Step 4: Remove boilerplate
-        if self.config.remove_boilerplate:
-            text = self._remove_boilerplate(text)
-
-        # Step 5: Final whitespace cleanup
-        text = self._normalize_whitespace(text)
-
-        return record.model_copy(
-            update={
-                "text": text,
-                "cleaned_at": datetime.utcnow(),
-            }
-        )
+        return record.replace(text=text, cleaned_at=datetime.utcnow())
 
     def clean_batch(self, records: Iterator[SpeechRecord]) -> Iterator[SpeechRecord]:
         """Clean a batch of speech records.
@@ -110,6 +145,22 @@ class TextCleaner:
             if len(cleaned.text) >= self.config.min_text_length:
                 yield cleaned
 
+    def _normalize_unicode(self, text: str) -> str:
+        """Apply the configured Unicode normalization form.
+
+        Every normalization form leaves ASCII unchanged, so ASCII strings
+        are returned as is without calling into unicodedata.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Normalized text
+        """
+        if text.isascii():
+            return text
+        return unicodedata.normalize(self.config.unicode_normalize, text)
+
     def _strip_html(self, text: str) -> str:
         """Remove HTML tags from text.
 
@@ -123,12 +174,14 @@ class TextCleaner:
             return text
 
         try:
-            # Parse as HTML and extract text
-            doc = html.fromstring(text)
+            # Parse as HTML fragment and extract text
+            doc = html.fragment_fromstring(
+                text, create_parent="div", parser=self._html_parser
+            )
             return doc.text_content()
         except Exception:
             # Fallback: simple regex removal
-            return re.sub(r"<[^>]+>", " ", text)
+            return self._TAG_RE.sub(" ", text)
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace in text.
@@ -139,18 +192,16 @@ class TextCleaner:
         Returns:
             Text with normalized whitespace
         """
-        # Replace various whitespace characters with regular space
-        text = re.sub(r"[\t\r\f\v]+", " ", text)
-
-        # Collapse multiple spaces
-        text = re.sub(r" {2,}", " ", text)
+        # Replace various whitespace characters with regular space and
+        # collapse multiple spaces
+        text = self._WS_RE.sub(" ", text)
 
         # Normalize newlines (max 2 consecutive)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = self._MULTI_NL_RE.sub("\n\n", text)
 
         # Remove leading/trailing whitespace from lines
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(lines)
+        text = self._TRAIL_WS_RE.sub("\n", text)
+        text = self._LEAD_WS_RE.sub("\n", text)
 
         # Final strip
         return text.strip()
@@ -158,16 +209,78 @@ class TextCleaner:
     def _remove_boilerplate(self, text: str) -> str:
         """Remove common boilerplate patterns.
 
+        Spaces are collapsed first so the patterns' single spaces match.
+
         Args:
             text: Input text
 
         Returns:
             Text with boilerplate removed
         """
-        for pattern in self._boilerplate_re:
-            text = pattern.sub("", text)
+        text = self._WS_RE.sub(" ", text)
+        if self._hs_db is not None:
+            return self._remove_boilerplate_hs(text)
+        return self._boilerplate_re.sub("", text)
+
+    def _compile_hyperscan(self) -> "hyperscan.Database":
+        """Compile the boilerplate patterns into a Hyperscan database.
+
+        Returns:
+            Block-mode database reporting leftmost match starts
+        """
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_SOM_LEFTMOST
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        patterns = self.BOILERPLATE_PATTERNS
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+        return db
+
+    def _remove_boilerplate_hs(self, text: str) -> str:
+        """Remove boilerplate patterns using Hyperscan.
+
+        Hyperscan reports every match end, so overlapping spans are merged
+        into their union before being cut out of the text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text with boilerplate removed
+        """
+        db = self._hs_db
+        assert db is not None
+        data = text.encode("utf-8")
+        spans: list[tuple[int, int]] = []
+
+        def on_match(_id: int, start: int, end: int, _flags: int, _ctx: object) -> None:
+            spans.append((start, end))
+
+        db.scan(data, match_event_handler=on_match)
+        if not spans:
+            return text
 
-        return text
+        spans.sort()
+        pieces = []
+        pos = 0
+        cut_start, cut_end = spans[0]
+        for start, end in spans[1:]:
+            if start <= cut_end:
+                cut_end = max(cut_end, end)
+                continue
+            pieces.append(data[pos:cut_start])
+            pos = cut_end
+            cut_start, cut_end = start, end
+        pieces.append(data[pos:cut_start])
+        pieces.append(data[cut_end:])
+        return b"".join(pieces).decode("utf-8")
 
     def clean_speaker(self, speaker: str) -> str:
         """Clean and normalize a speaker name.
@@ -182,22 +295,13 @@ class TextCleaner:
             return "Unknown"
 
         # Unicode normalize
-        speaker = unicodedata.normalize(self.config.unicode_normalize, speaker)
+        speaker = self._normalize_unicode(speaker)
 
         # Remove titles/prefixes
-        prefixes = [
-            r"^M\.\s+",
-            r"^Mme\.?\s+",
-            r"^Mlle\.?\s+",
-            r"^Dr\.?\s+",
-            r"^Pr\.?\s+",
-            r"^Me\.?\s+",
-        ]
-        for prefix in prefixes:
-            speaker = re.sub(prefix, "", speaker, flags=re.IGNORECASE)
+        speaker = self._PREFIX_RE.sub("", speaker)
 
         # Remove parenthetical info
-        speaker = re.sub(r"\s*\([^)]*\)\s*", " ", speaker)
+        speaker = self._PAREN_RE.sub(" ", speaker)
 
         # Normalize whitespace
         speaker = " ".join(speaker.split())
@@ -217,7 +321,7 @@ class TextCleaner:
             return "Untitled"
 
         # Unicode normalize
-        title = unicodedata.normalize(self.config.unicode_normalize, title)
+        title = self._normalize_unicode(title)
 
         # Normalize whitespace
         title = " ".join(title.split())
@@ -1,17 +1,32 @@
 """Deduplication processor."""
 
-from typing import Iterator, Set
+from operator import attrgetter
+from typing import Callable, Iterator, Optional, Set, Union
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # optional, only needed for near-duplicate detection
+    MinHash = MinHashLSH = None
+
+try:
+    from pyroaring import BitMap64
+except ImportError:  # optional, only needed for the roaring dedupe backend
+    BitMap64 = None
 
 from ..config import ProcessingConfig
 from ..models import SpeechRecord
-from ..utils.hashing import compute_hash
+from ..utils.hashing import (
+    compute_hash_int,
+    compute_parts_hash_int,
+    hash_to_hex,
+)
 from ..utils.logging import get_logger
 
 
 class Deduplicator:
     """Removes duplicate speech records based on text hash.
 
-    Uses xxhash64 (default) or SHA256 to hash the cleaned text
+    Uses xxh3 (default), xxhash64 or SHA256 to hash the cleaned text
     content and filter out duplicates.
     """
 
@@ -23,10 +38,46 @@ class Deduplicator:
         """
         self.config = config
         self.logger = get_logger()
-        self.seen_hashes: Set[str] = set()
+        # Integer digests: smaller than hex strings and cheaper to hash
+        self.seen_hashes: Union[Set[int], "BitMap64"] = self._new_seen_store()
         self.total_seen: int = 0
         self.duplicates_found: int = 0
 
+        # Key settings resolved once for compute_record_key. Names that are
+        # not record fields never contribute a value, so they are dropped and
+        # the remaining fields are read with a single attrgetter call.
+        self._algorithm = config.dedupe_hash_algorithm
+        fields = config.dedupe_fields
+        self._key_field: Optional[str] = fields[0] if len(fields) == 1 else None
+        known = tuple(f for f in fields if f in SpeechRecord.model_fields)
+        if len(known) > 1:
+            self._key_values: Callable[[SpeechRecord], tuple] = attrgetter(*known)
+        else:
+            self._key_values = lambda record: tuple(getattr(record, f) for f in known)
+
+    def _new_seen_store(self) -> Union[Set[int], "BitMap64"]:
+        """Create the empty store of seen hashes for the configured backend.
+
+        The roaring backend keeps the 64-bit digests in a compressed
+        bitmap, which takes far less memory per entry than a set once
+        hundreds of millions of records have been seen.
+
+        Returns:
+            A set, or a pyroaring BitMap64
+        """
+        if self.config.dedupe_backend != "roaring":
+            return set()
+        if BitMap64 is None:
+            raise ImportError(
+                "The roaring dedupe backend requires pyroaring (pip install pyroaring)"
+            )
+        if self.config.dedupe_hash_algorithm == "sha256":
+            raise ValueError(
+                "The roaring dedupe backend stores 64-bit hashes; "
+                "use xxh3 or xxhash64"
+            )
+        return BitMap64()
+
     def compute_record_hash(self, record: SpeechRecord) -> str:
         """Compute hash for a speech record.
 
@@ -36,15 +87,27 @@ class Deduplicator:
         Returns:
             Hex-encoded hash string
         """
-        # Build content to hash based on configured fields
-        parts = []
-        for field in self.config.dedupe_fields:
-            value = getattr(record, field, None)
-            if value:
-                parts.append(str(value))
+        return hash_to_hex(
+            self.compute_record_key(record), self.config.dedupe_hash_algorithm
+        )
+
+    def compute_record_key(self, record: SpeechRecord) -> int:
+        """Compute the integer hash used to track seen records.
+
+        Args:
+            record: Speech record to hash
+
+        Returns:
+            Hash value as an integer
+        """
+        # Common case: hash the one field directly
+        if self._key_field is not None:
+            value = getattr(record, self._key_field, None)
+            return compute_hash_int(str(value) if value else "", self._algorithm)
 
-        content = "\n".join(parts)
-        return compute_hash(content, self.config.dedupe_hash_algorithm)
+        # Stream the configured fields into the hasher
+        parts = [str(value) for value in self._key_values(record) if value]
+        return compute_parts_hash_int(parts, self._algorithm)
 
     def is_duplicate(self, record: SpeechRecord) -> bool:
         """Check if a record is a duplicate.
@@ -55,8 +118,7 @@ class Deduplicator:
         Returns:
             True if duplicate (already seen)
         """
-        text_hash = self.compute_record_hash(record)
-        return text_hash in self.seen_hashes
+        return self.compute_record_key(record) in self.seen_hashes
 
     def deduplicate(
         self, records: Iterator[SpeechRecord]
@@ -69,21 +131,22 @@ class Deduplicator:
         Yields:
             Unique speech records with text_hash set
         """
+        algorithm = self.config.dedupe_hash_algorithm
         for record in records:
             self.total_seen += 1
-            text_hash = self.compute_record_hash(record)
+            key = self.compute_record_key(record)
 
-            if text_hash in self.seen_hashes:
+            if key in self.seen_hashes:
                 self.duplicates_found += 1
                 self.logger.debug(
                     f"Duplicate found: {record.source}/{record.source_id}"
                 )
                 continue
 
-            self.seen_hashes.add(text_hash)
+            self.seen_hashes.add(key)
 
             # Add hash to record
-            yield record.model_copy(update={"text_hash": text_hash})
+            yield record.replace(text_hash=hash_to_hex(key, algorithm))
 
     def get_stats(self) -> dict:
         """Get deduplication statistics.
@@ -113,13 +176,60 @@ class CrossSourceDeduplicator(Deduplicator):
     """Deduplicator that tracks duplicates across sources.
 
     Extends the base deduplicator to keep track of which sources
-    contributed duplicates.
+    contributed duplicates. When ``near_dup_threshold`` is set, records
+    that are not exact duplicates are also looked up in a MinHash LSH
+    index of word shingles, and those estimated to be at least that
+    Jaccard-similar to an earlier record are dropped too.
+
+    With the roaring backend the source of each seen hash is not kept,
+    since a dict entry per hash would cost far more than the bitmap saves;
+    duplicates are then logged against an "unknown" original source.
     """
 
+    # MinHash settings for near-duplicate detection
+    NUM_PERM = 128
+    SHINGLE_SIZE = 5
+
     def __init__(self, config: ProcessingConfig):
         super().__init__(config)
         self.source_duplicates: dict[str, int] = {}
-        self.hash_to_source: dict[str, str] = {}
+        self.hash_to_source: dict[int, str] = {}
+        self._track_sources = config.dedupe_backend != "roaring"
+        self.near_duplicates_found: int = 0
+
+        self._lsh: Optional["MinHashLSH"] = None
+        if config.near_dup_threshold is not None:
+            if MinHashLSH is None:
+                raise ImportError(
+                    "Near-duplicate detection requires datasketch "
+                    "(pip install datasketch)"
+                )
+            self._lsh = self._new_lsh()
+
+    def _new_lsh(self) -> "MinHashLSH":
+        """Create an empty LSH index for the configured threshold."""
+        return MinHashLSH(
+            threshold=self.config.near_dup_threshold, num_perm=self.NUM_PERM
+        )
+
+    def _minhash(self, text: str) -> "MinHash":
+        """Compute the MinHash of a text's word shingles.
+
+        Args:
+            text: Cleaned text
+
+        Returns:
+            MinHash signature
+        """
+        words = text.split()
+        size = self.SHINGLE_SIZE
+        shingles = {
+            " ".join(words[i : i + size]).encode("utf-8")
+            for i in range(max(1, len(words) - size + 1))
+        }
+        minhash = MinHash(num_perm=self.NUM_PERM)
+        minhash.update_batch(shingles)
+        return minhash
 
     def deduplicate(
         self, records: Iterator[SpeechRecord]
@@ -132,15 +242,16 @@ class CrossSourceDeduplicator(Deduplicator):
         Yields:
             Unique speech records
         """
+        algorithm = self.config.dedupe_hash_algorithm
         for record in records:
             self.total_seen += 1
-            text_hash = self.compute_record_hash(record)
+            key = self.compute_record_key(record)
 
-            if text_hash in self.seen_hashes:
+            if key in self.seen_hashes:
                 self.duplicates_found += 1
 
                 # Track which source had the duplicate
-                original_source = self.hash_to_source.get(text_hash, "unknown")
+                original_source = self.hash_to_source.get(key, "unknown")
                 self.source_duplicates[record.source] = (
                     self.source_duplicates.get(record.source, 0) + 1
                 )
@@ -151,15 +262,31 @@ class CrossSourceDeduplicator(Deduplicator):
                 )
                 continue
 
-            self.seen_hashes.add(text_hash)
-            self.hash_to_source[text_hash] = record.source
-
-            yield record.model_copy(update={"text_hash": text_hash})
+            if self._lsh is not None:
+                minhash = self._minhash(record.text)
+                if self._lsh.query(minhash):
+                    self.duplicates_found += 1
+                    self.near_duplicates_found += 1
+                    self.source_duplicates[record.source] = (
+                        self.source_duplicates.get(record.source, 0) + 1
+                    )
+                    self.logger.debug(
+                        f"Near duplicate: {record.source}/{record.source_id}"
+                    )
+                    continue
+                self._lsh.insert(key, minhash)
+
+            self.seen_hashes.add(key)
+            if self._track_sources:
+                self.hash_to_source[key] = record.source
+
+            yield record.replace(text_hash=hash_to_hex(key, algorithm))
 
     def get_stats(self) -> dict:
         """Get extended deduplication statistics."""
         stats = super().get_stats()
         stats["source_duplicates"] = self.source_duplicates
+        stats["near_duplicates_found"] = self.near_duplicates_found
         return stats
 
     def reset(self) -> None:
@@ -167,3 +294,6 @@ class CrossSourceDeduplicator(Deduplicator):
         super().reset()
         self.source_duplicates.clear()
         self.hash_to_source.clear()
+        self.near_duplicates_found = 0
+        if self._lsh is not None:
+            self._lsh = self._new_lsh()
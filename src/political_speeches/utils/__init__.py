@@ -1,7 +1,8 @@
 """Utility modules."""
 
+from .eventloop import run_async
 from .http import RateLimitedClient
-from .hashing import compute_hash
+from .hashing import compute_hash, compute_hash_int
 from .logging import setup_logging, get_logger
 
-__all__ = ["RateLimitedClient", "compute_hash", "setup_logging", "get_logger"]
+__all__ = ["RateLimitedClient", "compute_hash", "compute_hash_int", "run_async", "setup_logging", "get_logger"]
@@ -0,0 +1,76 @@
+"""Date parsing helpers for source manifests."""
+
+from datetime import date
+from typing import Any, Optional
+
+try:
+    import ciso8601
+except ImportError:  # optional speedup
+    ciso8601 = None
+
+# Manifest fields holding a speech date, in order of preference. "prononciation"
+# is the delivery date in the current Vie-publique manifest; "mise_en_ligne"
+# (publication date) is the last resort.
+SPEECH_DATE_FIELDS = (
+    "prononciation",
+    "date",
+    "dateDiscours",
+    "date_discours",
+    "mise_en_ligne",
+)
+
+
+def parse_iso_date(value: Any) -> Optional[date]:
+    """Parse the ``YYYY-MM-DD`` prefix of an ISO date or datetime string.
+
+    Slices the year, month and day directly instead of going through
+    ``strptime``; any time or timezone suffix is ignored. Other ISO 8601
+    forms (e.g. basic ``YYYYMMDD``) are handed to ciso8601 when installed.
+
+    Args:
+        value: Date string (or value convertible to one)
+
+    Returns:
+        Date, or None if the prefix is not a valid ISO date
+    """
+    s = str(value)
+    if len(s) < 10 or s[4] != "-" or s[7] != "-":
+        if ciso8601 is None:
+            return None
+        try:
+            return ciso8601.parse_datetime(s).date()
+        except ValueError:
+            return None
+    try:
+        return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        return None
+
+
+def speech_date_value(speech: dict) -> Optional[str]:
+    """Return the raw date string of a manifest speech entry.
+
+    Args:
+        speech: Speech dictionary
+
+    Returns:
+        First non-empty date field as a string, or None
+    """
+    for field in SPEECH_DATE_FIELDS:
+        value = speech.get(field)
+        if value:
+            return str(value)
+    return None
+
+
+def parse_speech_date(speech: dict) -> Optional[date]:
+    """Parse the date of a manifest speech entry.
+
+    Args:
+        speech: Speech dictionary
+
+    Returns:
+        Date object or None if missing or unparseable
+    """
+    value = speech_date_value(speech)
+    return parse_iso_date(value) if value else None
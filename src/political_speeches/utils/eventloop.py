@@ -0,0 +1,38 @@
+"""Event loop selection for running the async collectors."""
+
+import asyncio
+import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return a faster event loop factory if one is installed.
+
+    Uses uvloop (or winloop on Windows) from the ``speedups`` extra.
+
+    Returns:
+        Loop factory, or None to use the default asyncio loop
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return None
+    return loop_impl.new_event_loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, like ``asyncio.run``.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(coro)
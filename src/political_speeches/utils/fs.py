@@ -0,0 +1,68 @@
+"""Filesystem helpers for enumerating raw data files."""
+
+import os
+from typing import Iterator, Union
+
+
+def iter_files(
+    root: Union[str, os.PathLike[str]], suffix: Union[str, tuple[str, ...]]
+) -> Iterator[str]:
+    """Recursively yield paths of files under ``root`` ending in ``suffix``.
+
+    Walks with ``os.scandir`` and yields plain ``str`` paths, avoiding the
+    per-entry ``Path`` allocation and glob matching of ``Path.rglob``.
+    Symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk
+        suffix: File name suffix, or tuple of suffixes, to match (e.g., '.xml')
+
+    Yields:
+        File paths as strings
+    """
+    try:
+        it = os.scandir(root)
+    except FileNotFoundError:
+        return
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, suffix)
+            elif entry.name.endswith(suffix):
+                yield entry.path
+
+
+def tree_stamp(root: Union[str, os.PathLike[str]]) -> tuple[int, int]:
+    """Summarize the files under ``root`` for change detection.
+
+    Editing, adding or removing a file changes the result, unlike the
+    directory's own mtime, which ignores edits to files in subdirectories
+    and to existing files. Symlinked directories are not followed.
+
+    Args:
+        root: File or directory to summarize
+
+    Returns:
+        Tuple of (number of files, newest modification time in ns); a
+        single file counts as one
+
+    Raises:
+        FileNotFoundError: If ``root`` does not exist
+    """
+    st = os.stat(root)
+    if not os.path.isdir(root):
+        return 1, st.st_mtime_ns
+
+    count = 0
+    newest = 0
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_count, sub_newest = tree_stamp(entry.path)
+                count += sub_count
+                newest = max(newest, sub_newest)
+            else:
+                count += 1
+                newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+    return count, newest
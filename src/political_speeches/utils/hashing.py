@@ -1,28 +1,40 @@
 """Hashing utilities for deduplication and checksums."""
 
 import hashlib
+import mmap
+import os
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal, Union
 
 import xxhash
 
+HashAlgorithm = Literal["xxh3", "xxhash64", "sha256"]
+
+# Hex digest length of each dedupe algorithm
+HEX_WIDTHS = {"xxh3": 16, "xxhash64": 16, "sha256": 64}
+
+# Files up to this size are checksummed through a single memory mapping
+MMAP_MAX_SIZE = 1024 * 1024 * 1024
+
 
 def compute_hash(
-    text: str,
-    algorithm: Literal["xxhash64", "sha256"] = "xxhash64",
+    text: Union[str, bytes],
+    algorithm: HashAlgorithm = "xxhash64",
 ) -> str:
     """Compute hash of text content.
 
     Args:
-        text: Text to hash
+        text: Text to hash (str is UTF-8 encoded first)
         algorithm: Hash algorithm to use
 
     Returns:
         Hex-encoded hash string
     """
-    encoded = text.encode("utf-8")
+    encoded = text.encode("utf-8") if isinstance(text, str) else text
 
-    if algorithm == "xxhash64":
+    if algorithm == "xxh3":
+        return xxhash.xxh3_64(encoded).hexdigest()
+    elif algorithm == "xxhash64":
         return xxhash.xxh64(encoded).hexdigest()
     elif algorithm == "sha256":
         return hashlib.sha256(encoded).hexdigest()
@@ -30,6 +42,86 @@ def compute_hash(
         raise ValueError(f"Unknown algorithm: {algorithm}")
 
 
+def compute_hash_int(
+    text: Union[str, bytes],
+    algorithm: HashAlgorithm = "xxhash64",
+) -> int:
+    """Compute hash of text content as an integer.
+
+    Integers make cheaper set and dict keys than hex strings; use
+    ``hash_to_hex`` to get the ``compute_hash`` form back.
+
+    Args:
+        text: Text to hash (str is UTF-8 encoded first)
+        algorithm: Hash algorithm to use
+
+    Returns:
+        Hash value as an unsigned integer
+    """
+    encoded = text.encode("utf-8") if isinstance(text, str) else text
+
+    if algorithm == "xxh3":
+        return xxhash.xxh3_64_intdigest(encoded)
+    elif algorithm == "xxhash64":
+        return xxhash.xxh64_intdigest(encoded)
+    elif algorithm == "sha256":
+        return int.from_bytes(hashlib.sha256(encoded).digest(), "big")
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def compute_parts_hash_int(
+    parts: Iterable[str], algorithm: HashAlgorithm = "xxhash64"
+) -> int:
+    """Hash newline-separated parts as an integer, without joining them.
+
+    Equal to ``compute_hash_int("\\n".join(parts), algorithm)``, but each
+    part is fed to an incremental hasher instead of first being copied
+    into one joined string.
+
+    Args:
+        parts: Text parts to hash
+        algorithm: Hash algorithm to use
+
+    Returns:
+        Hash value as an unsigned integer
+    """
+    hasher: Union[xxhash.xxh3_64, xxhash.xxh64, "hashlib._Hash"]
+    if algorithm == "xxh3":
+        hasher = xxhash.xxh3_64()
+    elif algorithm == "xxhash64":
+        hasher = xxhash.xxh64()
+    elif algorithm == "sha256":
+        hasher = hashlib.sha256()
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    separator = b""
+    for part in parts:
+        hasher.update(separator)
+        hasher.update(part.encode("utf-8"))
+        separator = b"\n"
+
+    if isinstance(hasher, (xxhash.xxh3_64, xxhash.xxh64)):
+        return hasher.intdigest()
+    return int.from_bytes(hasher.digest(), "big")
+
+
+def hash_to_hex(
+    value: int, algorithm: HashAlgorithm = "xxhash64"
+) -> str:
+    """Format an integer hash as the hex string ``compute_hash`` returns.
+
+    Args:
+        value: Hash value from ``compute_hash_int``
+        algorithm: Hash algorithm that produced it
+
+    Returns:
+        Zero-padded hex-encoded hash string
+    """
+    return format(value, f"0{HEX_WIDTHS[algorithm]}x")
+
+
 def compute_file_checksum(filepath: Path, algorithm: str = "sha256") -> str:
     """Compute checksum of a file.
 
@@ -40,10 +132,15 @@ def compute_file_checksum(filepath: Path, algorithm: str = "sha256") -> str:
     Returns:
         Hex-encoded checksum string
     """
-    hasher = hashlib.new(algorithm)
-
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-
-    return hasher.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= MMAP_MAX_SIZE:
+            # The whole mapping goes to update() in one call, so the digest
+            # runs as a single C loop over the file's pages
+            hasher = hashlib.new(algorithm)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+            return hasher.hexdigest()
+        # Empty files cannot be mapped; very large ones are read in chunks
+        # to keep the address space in use bounded
+        return hashlib.file_digest(f, algorithm).hexdigest()
@@ -1,24 +1,87 @@
 """HTTP client with rate limiting and retry logic."""
 
 import asyncio
+import importlib.util
+import mmap
+import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional, TypeVar
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
 
 from ..config import HttpConfig
+from .http_cache import ResponseCache
 from .logging import get_logger
 
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upper bound on a single retry wait, in seconds
+MAX_RETRY_WAIT = 60
+
+# Upper bound on a wait requested by a server's Retry-After header, in seconds
+MAX_RETRY_AFTER = 300
+
+# Statuses whose Retry-After header says when to try again
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Failures that are retried: error statuses and transient network errors
+RETRYABLE_ERRORS = (
+    httpx.HTTPStatusError,
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.TimeoutException,
+)
+
+T = TypeVar("T")
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read the wait requested by a response's ``Retry-After`` header.
+
+    Args:
+        response: Response of a failed request
+
+    Returns:
+        Seconds to wait, capped at ``MAX_RETRY_AFTER``, or None if the
+        status does not carry one or the header is missing or invalid
+    """
+    if response.status_code not in RETRY_AFTER_STATUSES:
+        return None
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+
+    # Either a number of seconds or an HTTP date
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
 
 class RateLimitedClient:
     """HTTP client with rate limiting and automatic retries."""
 
+    # Files of at least two parts are downloaded as concurrent byte ranges
+    RANGE_PART_SIZE = 8 * 1024 * 1024
+    MAX_RANGE_PARTS = 8
+
+    # Write buffer of downloaded files, so small chunks are coalesced
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, config: Optional[HttpConfig] = None):
         """Initialize the HTTP client.
 
@@ -27,51 +90,137 @@ class RateLimitedClient:
         """
         self.config = config or HttpConfig()
         self.logger = get_logger()
-        self._last_request_time: float = 0
+        # Token bucket: holds up to rate_limit_burst tokens and refills one
+        # token every rate_limit_delay seconds
+        self._tokens: float = float(self.config.rate_limit_burst)
+        self._last_refill: Optional[float] = None
         self._client: Optional[httpx.AsyncClient] = None
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(Path(self.config.cache_dir)) if self.config.cache_dir else None
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
         if self._client is None:
+            # Requests to the same host multiplex over one HTTP/2 connection
+            # instead of each opening its own TCP/TLS connection
+            http2 = self.config.http2 and HTTP2_AVAILABLE
+            if self.config.http2 and not http2:
+                self.logger.debug("h2 is not installed, falling back to HTTP/1.1")
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.config.timeout),
                 follow_redirects=True,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
             )
         return self._client
 
-    async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        loop = asyncio.get_event_loop()
-        now = loop.time()
-        elapsed = now - self._last_request_time
-
-        if elapsed < self.config.rate_limit_delay:
-            delay = self.config.rate_limit_delay - elapsed
-            await asyncio.sleep(delay)
-
-        self._last_request_time = loop.time()
-
-    def _create_retry_decorator(self):
-        """Create a retry decorator with current config."""
-        return retry(
-            stop=stop_after_attempt(self.config.max_retries),
-            wait=wait_exponential(
-                multiplier=self.config.retry_backoff,
-                min=1,
-                max=60,
-            ),
-            retry=retry_if_exception_type(
-                (httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException)
-            ),
-            before_sleep=lambda retry_state: self.logger.warning(
-                f"Retrying request (attempt {retry_state.attempt_number}): "
-                f"{retry_state.outcome.exception() if retry_state.outcome else 'unknown'}"
-            ),
-        )
+    async def _acquire(self, cost: float = 1.0) -> None:
+        """Take tokens from the rate-limit bucket, waiting if it is empty.
+
+        Requests go out immediately while tokens are left, so bursts of up
+        to ``rate_limit_burst`` requests are not delayed, and the long-run
+        rate stays bounded by one request per ``rate_limit_delay``. A caller
+        that finds the bucket empty takes its tokens anyway, leaving it in
+        debt, and sleeps until the refill has covered that debt; later
+        callers queue behind it without a lock or a retry loop.
+
+        Args:
+            cost: Number of tokens the request uses
+        """
+        delay = self.config.rate_limit_delay
+        if delay <= 0:
+            return
+
+        now = time.monotonic()
+        if self._last_refill is not None:
+            self._tokens = min(
+                self.config.rate_limit_burst,
+                self._tokens + (now - self._last_refill) / delay,
+            )
+        self._last_refill = now
+
+        self._tokens -= cost
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * delay)
+
+    async def _with_retries(
+        self, fn: Callable[..., Awaitable[T]], *args: object
+    ) -> T:
+        """Await ``fn(*args)``, retrying transient failures.
+
+        Up to ``max_retries`` attempts are made; the last failure is
+        re-raised as is. A plain loop rather than a retry library, so the
+        common case of a request that succeeds first time costs no more
+        than the call itself.
+
+        Args:
+            fn: Coroutine function performing one attempt
+            *args: Arguments passed to ``fn``
+
+        Returns:
+            Result of the first successful attempt
+        """
+        attempt = 1
+        previous_wait = 0.0
+        while True:
+            try:
+                return await fn(*args)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.config.max_retries:
+                    raise
+                wait = self._retry_wait(e, attempt, previous_wait)
+                self._log_retry(attempt, e)
+                await asyncio.sleep(wait)
+                previous_wait = wait
+                attempt += 1
+
+    def _retry_wait(
+        self, error: Exception, attempt: int, previous_wait: float
+    ) -> float:
+        """Choose how long to wait before retrying a failed attempt.
+
+        A 429 or 503 response with ``Retry-After`` says exactly when to come
+        back. Otherwise waits are randomized ("jittered") so that requests
+        failing together, e.g. during a brief server outage, do not all
+        retry at the same time: "full" jitter draws between 0 and the
+        exponential backoff, "decorrelated" between ``retry_backoff`` and
+        three times the previous wait.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Number of the failed attempt, from 1
+            previous_wait: Wait before the failed attempt, 0 for the first
+
+        Returns:
+            Seconds to wait
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = retry_after_seconds(error.response)
+            if retry_after is not None:
+                return retry_after
+
+        base = self.config.retry_backoff
+        if self.config.retry_jitter == "decorrelated":
+            return min(MAX_RETRY_WAIT, random.uniform(base, max(base, previous_wait) * 3))
+        return random.uniform(0, min(MAX_RETRY_WAIT, base * 2 ** (attempt - 1)))
+
+    def _log_retry(self, attempt: int, error: Exception) -> None:
+        """Log a failed attempt before it is retried."""
+        # Formatted lazily, only if the warning is actually emitted
+        self.logger.warning("Retrying request (attempt %d): %s", attempt, error)
 
     async def get(self, url: str) -> httpx.Response:
         """Perform a GET request with rate limiting and retries.
 
+        With ``cache_dir`` configured, responses are cached on disk and
+        revalidated with a conditional request; when the server answers
+        ``304 Not Modified`` the cached response is returned.
+
         Args:
             url: URL to fetch
 
@@ -81,17 +230,25 @@ class RateLimitedClient:
         Raises:
             httpx.HTTPStatusError: On HTTP error after retries exhausted
         """
-        retry_decorator = self._create_retry_decorator()
-
-        @retry_decorator
-        async def _do_get() -> httpx.Response:
-            await self._rate_limit()
-            client = await self._get_client()
-            response = await client.get(url)
-            response.raise_for_status()
-            return response
-
-        return await _do_get()
+        return await self._with_retries(self._get_once, url)
+
+    async def _get_once(self, url: str) -> httpx.Response:
+        """Perform a single rate-limited GET request."""
+        headers = self._cache.conditional_headers(url) if self._cache else None
+        await self._acquire()
+        client = await self._get_client()
+        response = await client.get(url, headers=headers)
+
+        if self._cache is not None:
+            if response.status_code == 304:
+                cached = self._cache.load(url, response.request)
+                if cached is not None:
+                    return cached
+            elif response.is_success:
+                self._cache.store(url, response)
+
+        response.raise_for_status()
+        return response
 
     async def get_text(self, url: str) -> str:
         """Fetch URL and return text content.
@@ -115,38 +272,235 @@ class RateLimitedClient:
             Parsed JSON data
         """
         response = await self.get(url)
-        return response.json()
-
-    async def download_file(self, url: str, dest: Path) -> Path:
+        # orjson parses the raw bytes directly, without decoding them to str
+        return orjson.loads(response.content)
+
+    async def download_file(
+        self,
+        url: str,
+        dest: Path,
+        etag: Optional[str] = None,
+    ) -> Optional[str]:
         """Download a file with streaming.
 
+        The body is written to a ``.part`` file which replaces ``dest`` only
+        once the byte count matches ``Content-Length``, so an interrupted
+        download never leaves a truncated file behind. When ``etag`` is given
+        the request is conditional and a 304 leaves ``dest`` untouched.
+
+        Large files served with ``Accept-Ranges: bytes`` are fetched as up to
+        ``MAX_RANGE_PARTS`` concurrent range requests; any failure on that
+        path falls back to a single streamed GET.
+
         Args:
             url: URL to download
             dest: Destination file path
+            etag: ETag of the copy already at ``dest``, if any
 
         Returns:
-            Path to downloaded file
+            ETag of the file now at ``dest`` (None if the server sent none)
         """
-        retry_decorator = self._create_retry_decorator()
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest.with_name(dest.name + ".part")
+
+        head = await self._head(url, etag)
+        if head is not None and head.status_code == 304:
+            return etag
+
+        size = self._ranged_size(head)
+        if head is not None and size is not None:
+            remote_etag = head.headers.get("ETag")
+            try:
+                await self._download_ranges(str(head.url), part_path, size, remote_etag)
+            except Exception as e:
+                self.logger.warning(
+                    f"Ranged download of {url} failed ({e}), retrying as a single stream"
+                )
+            else:
+                os.replace(part_path, dest)
+                return remote_etag
+
+        return await self._download_stream(url, dest, part_path, etag)
+
+    async def _head(self, url: str, etag: Optional[str]) -> Optional[httpx.Response]:
+        """Issue a HEAD request, returning None if the server rejects it."""
+        headers = {"If-None-Match": etag} if etag else None
+        await self._acquire()
+        client = await self._get_client()
+        try:
+            response = await client.head(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"HEAD {url} failed: {e}")
+            return None
+        if response.status_code != 304 and not response.is_success:
+            return None
+        return response
+
+    def _ranged_size(self, head: Optional[httpx.Response]) -> Optional[int]:
+        """Return the body size if it is worth fetching in ranges, else None."""
+        if head is None or head.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+        # Byte ranges apply to the encoded body, which we want decoded
+        if head.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        try:
+            size = int(head.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+        return size if size >= 2 * self.RANGE_PART_SIZE else None
+
+    async def _download_ranges(
+        self,
+        url: str,
+        part_path: Path,
+        size: int,
+        etag: Optional[str],
+    ) -> None:
+        """Fetch ``size`` bytes as concurrent range requests into ``part_path``."""
+        parts = min(self.MAX_RANGE_PARTS, size // self.RANGE_PART_SIZE)
+        bounds = [(i * size // parts, (i + 1) * size // parts - 1) for i in range(parts)]
+
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+        self.logger.info(f"Downloading {url} in {parts} ranges ({size} bytes)")
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for start, end in bounds:
+                    tg.create_task(
+                        self._with_retries(
+                            self._fetch_range, url, part_path, start, end, etag
+                        )
+                    )
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+    async def _fetch_range(
+        self,
+        url: str,
+        part_path: Path,
+        start: int,
+        end: int,
+        etag: Optional[str],
+    ) -> None:
+        """Fetch bytes ``start``-``end`` of ``url`` into place in ``part_path``."""
+        await self._acquire()
+        headers = {"Range": f"bytes={start}-{end}"}
+        if etag:
+            # The server answers 200 with the full body if the file changed
+            headers["If-Range"] = etag
+
+        client = await self._get_client()
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RuntimeError(f"server answered {response.status_code} to a range request")
+
+            with open(part_path, "r+b", buffering=self.WRITE_BUFFER_SIZE) as f:
+                f.seek(start)
+                async for chunk in response.aiter_raw(
+                    chunk_size=self.config.download_chunk_size
+                ):
+                    f.write(chunk)
+                written = f.tell() - start
+
+        if written != end - start + 1:
+            raise httpx.ReadError(
+                f"Incomplete range {start}-{end} of {url}: got {written} bytes",
+                request=response.request,
+            )
 
-        @retry_decorator
-        async def _do_download() -> Path:
-            await self._rate_limit()
-            client = await self._get_client()
+    async def _download_stream(
+        self,
+        url: str,
+        dest: Path,
+        part_path: Path,
+        etag: Optional[str],
+    ) -> Optional[str]:
+        """Download ``url`` as a single streamed GET via ``part_path``."""
+        return await self._with_retries(
+            self._download_once, url, dest, part_path, etag
+        )
 
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
+    async def _download_once(
+        self,
+        url: str,
+        dest: Path,
+        part_path: Path,
+        etag: Optional[str],
+    ) -> Optional[str]:
+        """Perform a single rate-limited streamed download attempt."""
+        headers = {"If-None-Match": etag} if etag else None
+        await self._acquire()
+        client = await self._get_client()
+
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                return etag
+            response.raise_for_status()
+
+            await self._write_body(response, part_path)
 
-                # Ensure parent directory exists
-                dest.parent.mkdir(parents=True, exist_ok=True)
+            expected = response.headers.get("Content-Length")
+            if expected is not None and int(expected) != response.num_bytes_downloaded:
+                part_path.unlink(missing_ok=True)
+                raise httpx.ReadError(
+                    f"Incomplete download of {url}: got "
+                    f"{response.num_bytes_downloaded} of {expected} bytes",
+                    request=response.request,
+                )
 
-                with open(dest, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
+            os.replace(part_path, dest)
+            return response.headers.get("ETag")
 
-            return dest
+    async def _write_body(self, response: httpx.Response, part_path: Path) -> None:
+        """Write a streamed response body to ``part_path``.
 
-        return await _do_download()
+        When the body size is known up front (a ``Content-Length`` and no
+        content encoding), the file is preallocated and memory-mapped and
+        each chunk is copied straight into the mapping, without a write
+        call per chunk. Otherwise chunks go through a large write buffer,
+        which coalesces them into few write calls.
+
+        Args:
+            response: Streaming response, status already checked
+            part_path: File to write
+        """
+        chunk_size = self.config.download_chunk_size
+        try:
+            size = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            size = 0
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            size = 0
+
+        if size <= 0:
+            with open(part_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    f.write(chunk)
+            return
+
+        overflow = False
+        with open(part_path, "w+b") as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as mm:
+                offset = 0
+                async for chunk in response.aiter_raw(chunk_size=chunk_size):
+                    end = offset + len(chunk)
+                    if end > size:
+                        overflow = True
+                        break
+                    mm[offset:end] = chunk
+                    offset = end
+
+        if overflow:
+            part_path.unlink(missing_ok=True)
+            raise httpx.ReadError(
+                f"Download of {response.url} is longer than its "
+                f"Content-Length of {size} bytes",
+                request=response.request,
+            )
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -165,33 +519,61 @@ class RateLimitedClient:
 
 # Synchronous wrapper for simple use cases
 class SyncClient:
-    """Synchronous HTTP client wrapper."""
+    """Synchronous HTTP client wrapper.
+
+    One ``httpx.Client`` is kept for the wrapper's lifetime, so repeated
+    requests reuse its connections instead of each opening a new one.
+    """
 
     def __init__(self, config: Optional[HttpConfig] = None):
         self.config = config or HttpConfig()
+        self._client: Optional[httpx.Client] = None
+
+    def _get_client(self) -> httpx.Client:
+        """Get or create the HTTP client."""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.config.timeout,
+                follow_redirects=True,
+                http2=self.config.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+        return self._client
 
     def get(self, url: str) -> httpx.Response:
         """Perform a synchronous GET request."""
-        with httpx.Client(
-            timeout=self.config.timeout,
-            follow_redirects=True,
-        ) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return response
+        response = self._get_client().get(url)
+        response.raise_for_status()
+        return response
 
     def download_file(self, url: str, dest: Path) -> Path:
         """Download a file synchronously."""
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        with httpx.Client(
-            timeout=self.config.timeout,
-            follow_redirects=True,
-        ) as client:
-            with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(dest, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
+        with self._get_client().stream("GET", url) as response:
+            response.raise_for_status()
+            with open(dest, "wb", buffering=RateLimitedClient.WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_bytes(
+                    chunk_size=self.config.download_chunk_size
+                ):
+                    f.write(chunk)
 
         return dest
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "SyncClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,121 @@
+"""On-disk cache of HTTP responses, revalidated with ETag/Last-Modified."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import orjson
+
+# Headers describing the encoded body; the cache stores the decoded body
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class ResponseCache:
+    """Stores response bodies and headers on disk, keyed by URL.
+
+    Only successful responses carrying an ``ETag`` or ``Last-Modified``
+    header are stored. A stored entry supplies the conditional headers for
+    the next request to the same URL, and a ``304 Not Modified`` answer is
+    then served from disk without downloading the body again.
+
+    Each entry is two files under ``<cache_dir>/<ab>/``: the body and a
+    JSON file with the headers, named after the SHA-1 of the URL.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached responses
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        """Return the body and header file paths of a URL."""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = self.cache_dir / key[:2] / key[2:]
+        return base.with_suffix(".body"), base.with_suffix(".json")
+
+    def _load_headers(self, url: str) -> Optional[list[tuple[str, str]]]:
+        """Return the stored headers of a URL, or None if not cached."""
+        _, meta_path = self._paths(url)
+        try:
+            stored = orjson.loads(meta_path.read_bytes())["headers"]
+        except (FileNotFoundError, orjson.JSONDecodeError, KeyError):
+            return None
+        # JSON has no tuples; httpx expects (name, value) pairs
+        return [(name, value) for name, value in stored]
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Build the revalidation headers for a cached URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, empty if the
+            URL is not cached
+        """
+        stored = self._load_headers(url)
+        if stored is None:
+            return {}
+        headers = httpx.Headers(stored)
+        conditional = {}
+        if "ETag" in headers:
+            conditional["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def load(self, url: str, request: httpx.Request) -> Optional[httpx.Response]:
+        """Rebuild the cached response of a URL.
+
+        Args:
+            url: Requested URL
+            request: Request the response answers
+
+        Returns:
+            Response with the cached headers and body, or None if the URL
+            is not cached
+        """
+        stored = self._load_headers(url)
+        if stored is None:
+            return None
+        body_path, _ = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return httpx.Response(200, headers=stored, content=body, request=request)
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """Store a response if it can be revalidated later.
+
+        Args:
+            url: Requested URL
+            response: Successful, fully read response
+        """
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return
+
+        body_path, meta_path = self._paths(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        headers = [
+            [name, value]
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+
+        # Each file is replaced atomically; the headers go last so an entry
+        # is only visible once its body is complete
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, orjson.dumps({"url": url, "headers": headers}))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
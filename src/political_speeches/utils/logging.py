@@ -1,6 +1,7 @@
 """Logging configuration using rich."""
 
 import logging
+import sys
 from typing import Optional
 
 from rich.console import Console
@@ -8,12 +9,17 @@ from rich.logging import RichHandler
 
 # Module-level logger
 _logger: Optional[logging.Logger] = None
-_console = Console(stderr=True)
+# Created on first use, so importing the package does not build a console
+_console: Optional[Console] = None
 
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Configure logging with rich handler.
 
+    Rich formatting is only used when stderr is a terminal; when it is
+    redirected (CI, cron, log files) records go through a plain stream
+    handler instead.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
@@ -22,19 +28,28 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     """
     global _logger
 
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=_console,
-                rich_tracebacks=True,
-                show_path=False,
-                markup=True,
-            )
-        ],
-    )
+    # Already configured: only apply the level, without building another
+    # handler (basicConfig would ignore it, and the level with it)
+    if _logger is not None:
+        logging.getLogger().setLevel(level)
+        return _logger
+
+    handler: logging.Handler
+    if sys.stderr.isatty():
+        handler = RichHandler(
+            console=get_console(),
+            rich_tracebacks=True,
+            show_path=False,
+            markup=True,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+        )
+
+    logging.basicConfig(level=level, handlers=[handler])
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -63,4 +78,7 @@ def get_console() -> Console:
     Returns:
         Rich console instance
     """
+    global _console
+    if _console is None:
+        _console = Console(stderr=True)
     return _console
@@ -0,0 +1,35 @@
+"""Streaming reader for Vie-publique speech manifests."""
+
+import mmap
+from typing import BinaryIO, Iterator, Union
+
+import ijson
+
+
+def iter_manifest(f: Union[BinaryIO, mmap.mmap]) -> Iterator[dict]:
+    """Stream speech entries from an open manifest file.
+
+    Handles both a top-level array and an object wrapping the array
+    under "discours" or "data". Entries are decoded one at a time, so
+    memory stays bounded by the largest single entry.
+
+    Args:
+        f: Manifest file opened in binary mode, or a mapping of it
+
+    Yields:
+        Speech dictionaries
+    """
+    is_object = f.read(64).lstrip()[:1] == b"{"
+    f.seek(0)
+
+    if not is_object:
+        yield from ijson.items(f, "item", use_float=True)
+        return
+
+    found = False
+    for speech in ijson.items(f, "discours.item", use_float=True):
+        found = True
+        yield speech
+    if not found:
+        f.seek(0)
+        yield from ijson.items(f, "data.item", use_float=True)